@@ -1,4 +1,5 @@
 # graphics/cad_renderer.py
+import math
 import numpy as np
 from typing import Dict, List, Tuple, NamedTuple
 from dataclasses import dataclass
@@ -21,10 +22,12 @@ class Vec3(NamedTuple):
         return self.x * other.x + self.y * other.y + self.z * other.z
     
     def normalize(self):
-        length = (self.x**2 + self.y**2 + self.z**2)**0.5
+        x, y, z = self
+        length = math.sqrt(x*x + y*y + z*z)
         if length < 1e-8:
             return Vec3(0, 0, 1)
-        return Vec3(self.x/length, self.y/length, self.z/length)
+        inv = 1.0 / length
+        return Vec3(x*inv, y*inv, z*inv)
     
     def cross(self, other):
         return Vec3(
@@ -33,41 +36,57 @@ class Vec3(NamedTuple):
             self.x * other.y - self.y * other.x
         )
 
-@dataclass
+_IDENTITY = np.eye(4, dtype=np.float32, order='F')
+_IDENTITY.flags.writeable = False
+
+@dataclass(slots=True)
 class Mat4:
-    """4x4 column-major matrix."""
-    m: List[float]  # 16 elements
+    """4x4 float32 matrix stored as a (4, 4) array; m[row, col], column-major in memory."""
+    m: np.ndarray
+    
+    def __post_init__(self):
+        # Accept the flat 16-element column-major layout as well
+        self.m = np.asfortranarray(np.asarray(self.m, dtype=np.float32).reshape(4, 4, order='F'))
+    
+    @property
+    def buffer(self) -> memoryview:
+        """16 column-major float32 values, ready for a GPU uniform upload."""
+        # A view of m itself; only a non-Fortran m assigned from outside is copied
+        return self.m.ravel(order='F').data
     
     @staticmethod
     def identity():
-        return Mat4([1,0,0,0, 0,1,0,0, 0,0,1,0, 0,0,0,1])
+        return Mat4(_IDENTITY.copy(order='F'))
+    
+    def resetIdentity(self) -> 'Mat4':
+        """Overwrite this matrix with identity in place, for reusable buffers."""
+        np.copyto(self.m, _IDENTITY)
+        return self
     
     @staticmethod
     def translate(v: Vec3):
         m = Mat4.identity()
-        m.m[12] = v.x
-        m.m[13] = v.y
-        m.m[14] = v.z
+        m.m[:3, 3] = v
         return m
     
     @staticmethod
     def scale(v: Vec3):
         m = Mat4.identity()
-        m.m[0] = v.x
-        m.m[5] = v.y
-        m.m[10] = v.z
+        m.m[0, 0] = v.x
+        m.m[1, 1] = v.y
+        m.m[2, 2] = v.z
         return m
     
     @staticmethod
     def ortho(left: float, right: float, bottom: float, top: float, near: float, far: float):
         """Orthographic projection (parallel lines, no perspective)."""
         m = Mat4.identity()
-        m.m[0] = 2.0 / (right - left)
-        m.m[5] = 2.0 / (top - bottom)
-        m.m[10] = -2.0 / (far - near)
-        m.m[12] = -(right + left) / (right - left)
-        m.m[13] = -(top + bottom) / (top - bottom)
-        m.m[14] = -(far + near) / (far - near)
+        m.m[0, 0] = 2.0 / (right - left)
+        m.m[1, 1] = 2.0 / (top - bottom)
+        m.m[2, 2] = -2.0 / (far - near)
+        m.m[0, 3] = -(right + left) / (right - left)
+        m.m[1, 3] = -(top + bottom) / (top - bottom)
+        m.m[2, 3] = -(far + near) / (far - near)
         return m
     
     @staticmethod
@@ -75,12 +94,12 @@ class Mat4:
         """Perspective projection (converging lines)."""
         f = 1.0 / np.tan(fov / 2.0)
         m = Mat4.identity()
-        m.m[0] = f / aspect
-        m.m[5] = f
-        m.m[10] = (far + near) / (near - far)
-        m.m[11] = -1.0
-        m.m[14] = (2.0 * far * near) / (near - far)
-        m.m[15] = 0.0
+        m.m[0, 0] = f / aspect
+        m.m[1, 1] = f
+        m.m[2, 2] = (far + near) / (near - far)
+        m.m[3, 2] = -1.0
+        m.m[2, 3] = (2.0 * far * near) / (near - far)
+        m.m[3, 3] = 0.0
         return m
     
     @staticmethod
@@ -91,29 +110,18 @@ class Mat4:
         up_actual = right.cross(forward).normalize()
         
         m = Mat4.identity()
-        m.m[0] = right.x
-        m.m[4] = right.y
-        m.m[8] = right.z
-        m.m[1] = up_actual.x
-        m.m[5] = up_actual.y
-        m.m[9] = up_actual.z
-        m.m[2] = -forward.x
-        m.m[6] = -forward.y
-        m.m[10] = -forward.z
-        m.m[12] = -right.dot(eye)
-        m.m[13] = -up_actual.dot(eye)
-        m.m[14] = forward.dot(eye)
+        m.m[0, :3] = right
+        m.m[1, :3] = up_actual
+        m.m[2, :3] = -forward.x, -forward.y, -forward.z
+        m.m[0, 3] = -right.dot(eye)
+        m.m[1, 3] = -up_actual.dot(eye)
+        m.m[2, 3] = forward.dot(eye)
         
         return m
     
     def multiply(self, other: 'Mat4') -> 'Mat4':
-        """Matrix multiplication (column-major)."""
-        result = [0] * 16
-        for col in range(4):
-            for row in range(4):
-                for k in range(4):
-                    result[col * 4 + row] += self.m[k * 4 + row] * other.m[col * 4 + k]
-        return Mat4(result)
+        """Matrix multiplication."""
+        return Mat4(self.m @ other.m)
 
 @dataclass
 class ViewportProjection:
@@ -130,50 +138,24 @@ class CADRenderer:
         self.screenHeight = screenHeight
         self.viewportWidth = screenWidth / 2.0
         self.viewportHeight = screenHeight / 2.0
-    
-    def projectPoint(self, worldPos: Vec3, mvp: Mat4, 
-                     viewportX: float, viewportY: float, 
-                     vpWidth: float, vpHeight: float) -> ViewportProjection:
-        """Project 3D point through MVP matrix to 2D screen in viewport."""
-        # Transform to clip space
-        x = mvp.m[0]*worldPos.x + mvp.m[4]*worldPos.y + mvp.m[8]*worldPos.z + mvp.m[12]
-        y = mvp.m[1]*worldPos.x + mvp.m[5]*worldPos.y + mvp.m[9]*worldPos.z + mvp.m[13]
-        z = mvp.m[2]*worldPos.x + mvp.m[6]*worldPos.y + mvp.m[10]*worldPos.z + mvp.m[14]
-        w = mvp.m[3]*worldPos.x + mvp.m[7]*worldPos.y + mvp.m[11]*worldPos.z + mvp.m[15]
-        
-        # Clip culling
-        if w < 0.001 or z < -1.0 or z > 1.0:
-            return ViewportProjection(visible=False, screenX=0, screenY=0, depth=0)
+        self.modelMatrix = Mat4.identity()
         
-        # Perspective divide → NDC
-        ndc_x = x / w
-        ndc_y = y / w
-        ndc_z = z / w
-        
-        # Viewport transform
-        screenX = (ndc_x + 1.0) * 0.5 * vpWidth + viewportX
-        screenY = (1.0 - ndc_y) * 0.5 * vpHeight + viewportY
-        
-        return ViewportProjection(
-            visible=True,
-            screenX=screenX,
-            screenY=screenY,
-            depth=ndc_z
-        )
+        # View/projection setup depends only on the model matrix and viewport size
+        self._views = None
+        self._viewsKey = None
     
-    def renderCAD(self, cubeVertices: List[Vec3], cubeIndices: List[int]) -> Dict:
-        """Render cube in 4-view quad layout.
-        
-        Returns: dict with viewport results:
-          'TOP': ortho view looking down from above
-          'ISO': isometric view
-          'FRONT': front ortho view
-          'CAMERA': perspective game camera view
-        """
-        results = {}
+    def setModelMatrix(self, M: Mat4) -> None:
+        """Set the model matrix applied to every view; cached MVPs are rebuilt lazily."""
+        self.modelMatrix = M
+        self._views = None
+    
+    def _getViews(self) -> List[Tuple[str, Mat4, float, float]]:
+        """(name, MVP, viewportX, viewportY) per quad view, built once per viewport size."""
+        key = (self.viewportWidth, self.viewportHeight)
+        if self._views is not None and self._viewsKey == key:
+            return self._views
         
-        # Identity model matrix (cube at origin)
-        M = Mat4.identity()
+        M = self.modelMatrix
         
         # --- View 1: TOP (Ortho, looking down -Y) ---
         V_top = Mat4.lookAt(Vec3(0, 10, 0), Vec3(0, 0, 0), Vec3(0, 0, -1))
@@ -193,20 +175,100 @@ class CADRenderer:
         P_persp = Mat4.perspective(1.04, self.viewportWidth / self.viewportHeight, 0.1, 100.0)
         MVP_camera = P_persp.multiply(V_persp).multiply(M)
         
-        # Project all vertices in each view
-        views = [
+        self._views = [
             ('TOP', MVP_top, 0, 0),
             ('ISO', MVP_iso, self.viewportWidth, 0),
             ('FRONT', MVP_front, 0, self.viewportHeight),
             ('CAMERA', MVP_camera, self.viewportWidth, self.viewportHeight)
         ]
+        self._viewsKey = key
+        return self._views
+    
+    def projectViews(self, worldPositions: np.ndarray, mvps: np.ndarray,
+                     viewportOrigins: np.ndarray,
+                     vpWidth: float, vpHeight: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Project (N, 3) points through V stacked (4, 4) MVPs into V viewports at once.
+        
+        Returns: (visible (V, N), screen (V, N, 2), depth (V, N)); culled points are zeroed.
+        """
+        world = np.asarray(worldPositions, dtype=np.float64).reshape(-1, 3)
+        mvps = np.asarray(mvps, dtype=np.float64).reshape(-1, 4, 4)
+        origins = np.asarray(viewportOrigins, dtype=np.float64).reshape(-1, 2)
         
-        for viewName, mvp, vpX, vpY in views:
-            projections = []
-            for vertex in cubeVertices:
-                proj = self.projectPoint(vertex, mvp, vpX, vpY, 
-                                        self.viewportWidth, self.viewportHeight)
-                projections.append(proj)
+        # Clip-space w first: points behind the camera are rejected before the rest
+        w = np.einsum('vj,nj->vn', mvps[:, 3, :3], world) + mvps[:, 3, None, 3]
+        visible = w >= 0.001
+        
+        screen = np.zeros(visible.shape + (2,))
+        depth = np.zeros(visible.shape)
+        for v in range(len(mvps)):
+            front = np.flatnonzero(visible[v])
+            
+            # Remaining clip coordinates → NDC, only for points in front of the camera
+            clip = world[front] @ mvps[v, :3, :3].T + mvps[v, :3, 3]
+            ndc = clip / w[v, front, None]
+            
+            # Depth range test in NDC
+            inside = (ndc[:, 2] >= -1.0) & (ndc[:, 2] <= 1.0)
+            front, ndc = front[inside], ndc[inside]
+            visible[v] = False
+            visible[v, front] = True
+            
+            # Viewport transform
+            screen[v, front, 0] = (ndc[:, 0] + 1.0) * 0.5 * vpWidth + origins[v, 0]
+            screen[v, front, 1] = (1.0 - ndc[:, 1]) * 0.5 * vpHeight + origins[v, 1]
+            depth[v, front] = ndc[:, 2]
+        
+        return visible, screen, depth
+    
+    def projectPoints(self, worldPositions: np.ndarray, mvp: Mat4,
+                      viewportX: float, viewportY: float,
+                      vpWidth: float, vpHeight: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Project (N, 3) points through MVP matrix to 2D screen in viewport.
+        
+        Returns: (visible (N,), screen (N, 2), depth (N,)); culled points are zeroed.
+        """
+        visible, screen, depth = self.projectViews(worldPositions, mvp.m, (viewportX, viewportY),
+                                                   vpWidth, vpHeight)
+        return visible[0], screen[0], depth[0]
+    
+    def projectPoint(self, worldPos: Vec3, mvp: Mat4, 
+                     viewportX: float, viewportY: float, 
+                     vpWidth: float, vpHeight: float) -> ViewportProjection:
+        """Project 3D point through MVP matrix to 2D screen in viewport."""
+        visible, screen, depth = self.projectPoints(worldPos, mvp, viewportX, viewportY,
+                                                    vpWidth, vpHeight)
+        return ViewportProjection(
+            visible=bool(visible[0]),
+            screenX=float(screen[0, 0]),
+            screenY=float(screen[0, 1]),
+            depth=float(depth[0])
+        )
+    
+    def renderCAD(self, cubeVertices: np.ndarray, cubeIndices: List[int]) -> Dict:
+        """Render cube in 4-view quad layout.
+        
+        Returns: dict with viewport results:
+          'TOP': ortho view looking down from above
+          'ISO': isometric view
+          'FRONT': front ortho view
+          'CAMERA': perspective game camera view
+        """
+        results = {}
+        vertices = np.asarray(cubeVertices, dtype=np.float64).reshape(-1, 3)
+        
+        # Project all vertices into all views in one batch
+        views = self._getViews()
+        mvps = np.stack([mvp.m for _, mvp, _, _ in views])
+        origins = np.array([(vpX, vpY) for _, _, vpX, vpY in views], dtype=np.float64)
+        visible, screen, depth = self.projectViews(vertices, mvps, origins,
+                                                   self.viewportWidth, self.viewportHeight)
+        
+        for v, (viewName, _, vpX, vpY) in enumerate(views):
+            projections = [
+                ViewportProjection(visible=vis, screenX=sx, screenY=sy, depth=d)
+                for vis, (sx, sy), d in zip(visible[v].tolist(), screen[v].tolist(), depth[v].tolist())
+            ]
             
             results[viewName] = {
                 'name': viewName,
@@ -220,13 +282,13 @@ class CADRenderer:
         
         return results
 
-def createCube(size: float = 2.0) -> Tuple[List[Vec3], List[int]]:
-    """Create a simple cube centered at origin."""
+def createCube(size: float = 2.0) -> Tuple[np.ndarray, List[int]]:
+    """Create a simple cube centered at origin as (8, 3) vertex positions."""
     s = size / 2.0
-    vertices = [
-        Vec3(-s, -s, -s), Vec3(s, -s, -s), Vec3(s, s, -s), Vec3(-s, s, -s),  # front
-        Vec3(-s, -s, s), Vec3(s, -s, s), Vec3(s, s, s), Vec3(-s, s, s),      # back
-    ]
+    vertices = np.array([
+        (-s, -s, -s), (s, -s, -s), (s, s, -s), (-s, s, -s),  # front
+        (-s, -s, s), (s, -s, s), (s, s, s), (-s, s, s),      # back
+    ], dtype=np.float64)
     
     indices = [
         0, 1, 2, 0, 2, 3,  # front
@@ -3,6 +3,55 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
+try:
+    from scipy import sparse
+except ImportError:  # scipy is optional; smoothing falls back to np.add.at
+    sparse = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; cube scan falls back to NumPy slices
+    njit = None
+
+
+if njit is not None:
+    # Explicit any-layout signature: compiled (or loaded from cache) at import,
+    # and one specialization serves both full volumes and macroblock slices
+    @njit('void(uint8[:, :, :], boolean[:, :, :])', parallel=True, cache=True)
+    def _scanActiveCubes(solid: np.ndarray, active: np.ndarray) -> None:
+        """Native active-cube scan, parallel over the x axis."""
+        for x in prange(active.shape[0]):
+            for y in range(active.shape[1]):
+                for z in range(active.shape[2]):
+                    solidCorners = (
+                        solid[x, y, z] + solid[x, y, z + 1] +
+                        solid[x, y + 1, z] + solid[x, y + 1, z + 1] +
+                        solid[x + 1, y, z] + solid[x + 1, y, z + 1] +
+                        solid[x + 1, y + 1, z] + solid[x + 1, y + 1, z + 1]
+                    )
+                    active[x, y, z] = 0 < solidCorners < 8
+else:
+    _scanActiveCubes = None
+
+def _hashNoise(x: np.ndarray, y: np.ndarray, z: np.ndarray) -> np.ndarray:
+    """Deterministic noise in [0, 1) per integer (x, y, z), via a xorshift-multiply hash.
+    
+    Pure uint32 arithmetic (wrapping multiplies, shifts, xors), so it is
+    branchless and much cheaper than a sin-based shader hash.
+    """
+    h = (x.astype(np.uint32) * np.uint32(0x9E3779B1)
+         ^ y.astype(np.uint32) * np.uint32(0x85EBCA77)
+         ^ z.astype(np.uint32) * np.uint32(0xC2B2AE3D))
+    h ^= h >> np.uint32(16)
+    h *= np.uint32(0x7FEB352D)
+    h ^= h >> np.uint32(15)
+    return (h & np.uint32(0xFFFFFF)) / float(0x1000000)
+
+# Edge length (in cubes) of the blocks used to skip uniform regions
+MACROBLOCK_SIZE = 8
+# Above this fraction of active blocks one full-volume scan is cheaper
+MACROBLOCK_SPARSE_FRACTION = 1.0 / 16
+
 @dataclass
 class MeshGeometry:
     """Output mesh with attributes and indices."""
@@ -35,6 +84,8 @@ class IntelligentSurfaceNets:
             volumeData: dict with 'volume' (3D binary array) and 'resolution' (dict with x,y,z)
         """
         self.volume = volumeData['volume']
+        # Only occupancy matters to the cube scan; quantize once
+        self.solid = (np.asarray(self.volume) > 0).astype(np.uint8)
         self.dims = volumeData['resolution']  # {x, y, z}
         self.smoothingFactor = 0.0
         self.detailMultiplier = 1.0
@@ -49,30 +100,20 @@ class IntelligentSurfaceNets:
     
     def generateMesh(self) -> MeshGeometry:
         """Core generation: surface extraction → topology → smoothing."""
-        vertices = []
-        indices = []
         width = int(self.dims['x'])
         height = int(self.dims['y'])
         depth = int(self.dims['z'])
         
         # 1. Extract surface crossings via cube marching
-        gridBuffer = {}  # Maps "x,y,z" → vertex index
-        
-        for x in range(width - 1):
-            for y in range(height - 1):
-                for z in range(depth - 1):
-                    # Check 8 corners of cube for surface
-                    mask = self._calculateCubeMask(x, y, z)
-                    
-                    # If surface exists (mixed solid/empty)
-                    if 0 < mask < 255:
-                        vertex = self._calculateIntelligentVertex(x, y, z)
-                        key = f"{x},{y},{z}"
-                        gridBuffer[key] = len(vertices) // 3
-                        vertices.extend([vertex['x'], vertex['y'], vertex['z']])
+        active = self._findActiveCubes(width, height, depth)
+        vertices = self._calculateIntelligentVertices(active)
+        
+        # Dense (x, y, z) → vertex index lookup, -1 where no vertex
+        gridIndex = np.full((width, height, depth), -1, dtype=np.int32)
+        gridIndex[active[:, 0], active[:, 1], active[:, 2]] = np.arange(len(active), dtype=np.int32)
         
         # 2. Generate topology (simplified quad connectivity)
-        self._generateTopology(gridBuffer, indices, width, height, depth)
+        indices = self._generateTopology(gridIndex)
         
         # 3. Laplacian smoothing
         if self.smoothingFactor > 0:
@@ -81,81 +122,182 @@ class IntelligentSurfaceNets:
             )
         
         return MeshGeometry(
-            vertices=np.array(vertices, dtype=np.float32).reshape(-1, 3),
-            indices=np.array(indices, dtype=np.uint32)
+            vertices=vertices,
+            indices=indices.astype(np.uint32)
         )
     
-    def _calculateIntelligentVertex(self, x: int, y: int, z: int) -> Dict[str, float]:
-        """Place vertex inside voxel with fractal DNA mutation."""
-        vx = float(x) + 0.5
-        vy = float(y) + 0.5
-        vz = float(z) + 0.5
+    def _calculateIntelligentVertices(self, active: np.ndarray) -> np.ndarray:
+        """Place one vertex inside each active voxel with fractal DNA mutation.
+        
+        Args:
+            active: (N, 3) integer cube coordinates
         
-        # Fractal noise: deterministic hash-based noise
+        Returns:
+            (N, 3) float32 vertex positions
+        """
+        vertices = np.empty((len(active), 3), dtype=np.float32)
+        np.add(active, 0.5, out=vertices, casting='unsafe')
+        
+        # Fractal noise: deterministic integer-hash noise, one offset per vertex
         if self.detailMultiplier > 1.0:
-            noise = np.sin(x * 12.9898 + y * 78.233 + z * 31.415) * 43758.5453
-            offset = (noise % 1.0) * 0.2 * (self.detailMultiplier - 1.0)
-            
-            vx += offset
-            vy += offset
-            vz += offset
+            noise = _hashNoise(active[:, 0], active[:, 1], active[:, 2])
+            offset = noise * 0.2 * (self.detailMultiplier - 1.0)
+            vertices += offset[:, None]
         
-        return {'x': vx, 'y': vy, 'z': vz}
+        return vertices
     
-    def _calculateCubeMask(self, x: int, y: int, z: int) -> int:
-        """Bitmask for 8 corners: 0=empty, 1=solid."""
-        mask = 0
+    def _findActiveCubes(self, width: int, height: int, depth: int) -> np.ndarray:
+        """(N, 3) coordinates of cubes mixing solid and empty corners, in x/y/z order.
+        
+        Large, sparse volumes are pruned by macroblock first: only blocks whose
+        voxels are not all equal are scanned, one block at a time.
+        """
+        solid = self.solid[:width, :height, :depth]
+        
+        blocks = None
+        if min(width, height, depth) > 2 * MACROBLOCK_SIZE:
+            blocks = self._findActiveMacroblocks(solid)
+        
+        if blocks is None or blocks.mean() > MACROBLOCK_SPARSE_FRACTION:
+            return np.argwhere(self._calculateActiveCubes(solid))
+        
+        B = MACROBLOCK_SIZE
+        found = [np.empty((0, 3), dtype=np.int64)]
+        for bx, by, bz in np.argwhere(blocks).tolist():
+            x0, y0, z0 = bx * B, by * B, bz * B
+            block = solid[x0:x0 + B + 1, y0:y0 + B + 1, z0:z0 + B + 1]
+            found.append(np.argwhere(self._calculateActiveCubes(block)) + (x0, y0, z0))
+        
+        active = np.concatenate(found)
+        return active[np.lexsort((active[:, 2], active[:, 1], active[:, 0]))]
+    
+    def _findActiveMacroblocks(self, solid: np.ndarray) -> np.ndarray:
+        """Flag each B³ block of cubes that can contain a surface crossing.
+        
+        Cubes in block b read voxels from voxel blocks b and b+1 on each axis,
+        so a cube block is active unless those 8 voxel blocks share one value.
+        """
+        B = MACROBLOCK_SIZE
+        padded = np.pad(solid, [(0, -n % B) for n in solid.shape], mode='edge')
+        nx, ny, nz = (n // B for n in padded.shape)
+        
+        # Per-axis reductions keep the inner loops contiguous
+        vmin = padded.reshape(nx, B, ny * B, nz * B).min(axis=1)
+        vmin = vmin.reshape(nx, ny, B, nz * B).min(axis=2)
+        vmin = vmin.reshape(nx, ny, nz, B).min(axis=3)
+        vmax = padded.reshape(nx, B, ny * B, nz * B).max(axis=1)
+        vmax = vmax.reshape(nx, ny, B, nz * B).max(axis=2)
+        vmax = vmax.reshape(nx, ny, nz, B).max(axis=3)
+        
+        vmin = np.pad(vmin, [(0, 1)] * 3, mode='edge')
+        vmax = np.pad(vmax, [(0, 1)] * 3, mode='edge')
+        cmin = vmin[:nx, :ny, :nz].copy()
+        cmax = vmax[:nx, :ny, :nz].copy()
         for i in range(2):
             for j in range(2):
                 for k in range(2):
-                    xi, yi, zi = x + i, y + j, z + k
-                    if 0 <= xi < self.dims['x'] and 0 <= yi < self.dims['y'] and 0 <= zi < self.dims['z']:
-                        if self.volume[xi, yi, zi] > 0:
-                            mask |= (1 << (i * 4 + j * 2 + k))
-        return mask
+                    np.minimum(cmin, vmin[i:i + nx, j:j + ny, k:k + nz], out=cmin)
+                    np.maximum(cmax, vmax[i:i + nx, j:j + ny, k:k + nz], out=cmax)
+        return cmin != cmax
     
-    def _generateTopology(self, gridBuffer: Dict, indices: List, width: int, height: int, depth: int) -> None:
-        """Connect vertices into faces (simplified: grid-based quads → triangles)."""
-        for x in range(width - 1):
-            for y in range(height - 1):
-                for z in range(depth - 1):
-                    # Check 4 edges of this cube face
-                    corners = [
-                        f"{x},{y},{z}",
-                        f"{x+1},{y},{z}",
-                        f"{x+1},{y+1},{z}",
-                        f"{x},{y+1},{z}"
-                    ]
-                    
-                    valid_corners = [gridBuffer.get(c) for c in corners if c in gridBuffer]
-                    
-                    # Create triangles from valid corners
-                    if len(valid_corners) >= 3:
-                        for i in range(1, len(valid_corners) - 1):
-                            indices.extend([valid_corners[0], valid_corners[i], valid_corners[i+1]])
+    def _calculateActiveCubes(self, solid: np.ndarray) -> np.ndarray:
+        """Flag every cube whose 8 corners are neither all empty nor all solid.
+        
+        Mask and classification are fused: the solid corners of each cube are
+        counted in one pass over 8 shifted slices and tested against 0 and 8,
+        so no per-cube bitmask is materialized.
+        """
+        width, height, depth = solid.shape
+        shape = (max(width - 1, 0), max(height - 1, 0), max(depth - 1, 0))
+        if _scanActiveCubes is not None:
+            active = np.empty(shape, dtype=np.bool_)
+            _scanActiveCubes(solid, active)
+            return active
+        
+        solidCorners = np.zeros(shape, dtype=np.uint8)
+        for i in range(2):
+            for j in range(2):
+                for k in range(2):
+                    solidCorners += solid[i:i + width - 1, j:j + height - 1, k:k + depth - 1]
+        # uint8 wrap-around: 0 → 255, so one compare rejects both 0 and 8
+        solidCorners -= 1
+        return solidCorners < 7
     
-    def _applyLaplacianSmoothing(self, vertices: List[float], indices: List[int], iterations: int) -> List[float]:
-        """Relax vertices toward neighbor average (skin-like smoothness)."""
-        vert_array = np.array(vertices, dtype=np.float32).reshape(-1, 3)
+    def _generateTopology(self, gridIndex: np.ndarray) -> np.ndarray:
+        """Connect vertices into faces (simplified: grid-based quads → triangles).
+        
+        Each cube contributes the quad (x,y,z), (x+1,y,z), (x+1,y+1,z), (x,y+1,z);
+        its valid corners are fanned into 1 or 2 triangles. All cubes are
+        handled with shifted views of the index grid instead of a Python loop.
+        """
+        # 4 corners of every cube face, shape (cubes, 4)
+        corners = np.stack([
+            gridIndex[:-1, :-1, :-1],
+            gridIndex[1:, :-1, :-1],
+            gridIndex[1:, 1:, :-1],
+            gridIndex[:-1, 1:, :-1]
+        ], axis=-1).reshape(-1, 4)
+        
+        valid = corners >= 0
+        count = valid.sum(axis=1)
+        faces = count >= 3
+        corners, valid, count = corners[faces], valid[faces], count[faces]
+        
+        # Pack valid corners to the front, keeping their quad order
+        order = np.argsort(~valid, axis=1, kind='stable')
+        packed = np.take_along_axis(corners, order, axis=1)
+        
+        # Fan triangulation: (c0, c1, c2) always, (c0, c2, c3) for full quads
+        triangles = np.stack([packed[:, [0, 1, 2]], packed[:, [0, 2, 3]]], axis=1)
+        emit = np.stack([np.ones(len(count), dtype=bool), count == 4], axis=1)
+        return triangles[emit].reshape(-1)
+    
+    def _applyLaplacianSmoothing(self, vertices: np.ndarray, indices: np.ndarray, iterations: int) -> np.ndarray:
+        """Relax vertices toward neighbor average (skin-like smoothness).
+        
+        Each triangle (a, b, c) contributes the directed edges a→b, b→c, c→a.
+        The adjacency is built once: with scipy the neighbor sums are one sparse
+        multiply per iteration, otherwise one np.add.reduceat over edges grouped
+        by source vertex. Vertices are relaxed in place in preallocated buffers.
+        """
+        vert_array = np.asarray(vertices, dtype=np.float32).reshape(-1, 3)
         vcount = len(vert_array)
         
+        faces = np.asarray(indices, dtype=np.int64).reshape(-1, 3)
+        src = faces.reshape(-1)
+        tgt = faces[:, [1, 2, 0]].reshape(-1)
+        counts = np.bincount(src, minlength=vcount)
+        connected = np.flatnonzero(counts)
+        
+        adjacency = None
+        if sparse is not None:
+            adjacency = sparse.csr_matrix(
+                (np.ones(len(src), dtype=np.float32), (src, tgt)), shape=(vcount, vcount)
+            )[connected]
+        else:
+            # CSR-style (starts, neighbors): edges sorted by source vertex
+            neighbors = tgt[np.argsort(src, kind='stable')]
+            starts = (np.cumsum(counts) - counts)[connected]
+            gathered = np.empty((len(neighbors), 3), dtype=np.float32)
+        weights = (self.smoothingFactor / counts[connected, None]).astype(np.float32)
+        
+        # Buffers reused by every iteration
+        sums = np.empty((len(connected), 3), dtype=np.float32)
+        current = np.empty_like(sums)
+        
         for _ in range(iterations):
-            offsets = np.zeros_like(vert_array)
-            counts = np.zeros(vcount)
-            
             # Accumulate neighbor positions
-            for i in range(0, len(indices), 3):
-                for j in range(3):
-                    src = indices[(i + j) % len(indices)]
-                    tgt = indices[(i + (j + 1) % 3) % len(indices)]
-                    if src < vcount and tgt < vcount:
-                        offsets[src] += vert_array[tgt]
-                        counts[src] += 1
+            if adjacency is not None:
+                sums[:] = adjacency @ vert_array
+            else:
+                np.take(vert_array, neighbors, axis=0, out=gathered)
+                np.add.reduceat(gathered, starts, axis=0, out=sums)
             
-            # Apply smoothing
-            for i in range(vcount):
-                if counts[i] > 0:
-                    target = offsets[i] / counts[i]
-                    vert_array[i] += (target - vert_array[i]) * self.smoothingFactor
+            # Apply smoothing: v += factor * (sum / count - v)
+            np.take(vert_array, connected, axis=0, out=current)
+            sums *= weights
+            current *= 1.0 - self.smoothingFactor
+            current += sums
+            vert_array[connected] = current
         
-        return vert_array.flatten().tolist()
+        return vert_array
@@ -5,9 +5,136 @@ Maps orchestrator decisions to visual properties (position, rotation, scale, col
 Provides a simple scene graph that can be used by rendering engines.
 """
 
+import re
+from types import MappingProxyType
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; world matrices fall back to NumPy
+    njit = None
+
+
+if njit is not None:
+    @njit('void(float32[:, :], float32[:, :], float32[:, :], float32[:, :, :])',
+          parallel=True, fastmath=True, cache=True)
+    def _build_world_matrices(positions, rotations, scales, out):
+        """Native T * R * S build, parallel over objects (see compute_world_matrices)."""
+        for i in prange(out.shape[0]):
+            rx = np.radians(rotations[i, 0])
+            ry = np.radians(rotations[i, 1])
+            rz = np.radians(rotations[i, 2])
+            cx, cy, cz = np.cos(rx), np.cos(ry), np.cos(rz)
+            sx, sy, sz = np.sin(rx), np.sin(ry), np.sin(rz)
+            kx, ky, kz = scales[i, 0], scales[i, 1], scales[i, 2]
+            
+            out[i, 0, 0] = cy * cz * kx
+            out[i, 0, 1] = -cy * sz * ky
+            out[i, 0, 2] = sy * kz
+            out[i, 1, 0] = (cx * sz + sx * sy * cz) * kx
+            out[i, 1, 1] = (cx * cz - sx * sy * sz) * ky
+            out[i, 1, 2] = -sx * cy * kz
+            out[i, 2, 0] = (sx * sz - cx * sy * cz) * kx
+            out[i, 2, 1] = (sx * cz + cx * sy * sz) * ky
+            out[i, 2, 2] = cx * cy * kz
+            out[i, 0, 3] = positions[i, 0]
+            out[i, 1, 3] = positions[i, 1]
+            out[i, 2, 3] = positions[i, 2]
+            out[i, 3, 0] = 0.0
+            out[i, 3, 1] = 0.0
+            out[i, 3, 2] = 0.0
+            out[i, 3, 3] = 1.0
+else:
+    _build_world_matrices = None
+
+
+# Shared read-only default for missing orchestrator sections (no per-call dict)
+_EMPTY = MappingProxyType({})
+
+# Signed decimal or exponent float: orchestrator hues come from raw embeddings
+_FLOAT = r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+_HSL_PATTERN = re.compile(rf"hsl\(\s*({_FLOAT})\s*,\s*({_FLOAT})%\s*,\s*({_FLOAT})%\s*\)")
+
+
+def hsl_to_rgb(hsl: np.ndarray) -> np.ndarray:
+    """Convert a batch of HSL colors to RGB in one vectorized pass.
+    
+    Args:
+        hsl: (N, 3) hue, saturation, lightness in [0, 1]; hue wraps around,
+            saturation and lightness are clamped
+        
+    Returns:
+        (N, 3) float32 RGB in [0, 1]
+    """
+    hsl = np.asarray(hsl, dtype=np.float32).reshape(-1, 3)
+    h = hsl[:, 0:1]
+    s = np.clip(hsl[:, 1:2], 0.0, 1.0)
+    l = np.clip(hsl[:, 2:3], 0.0, 1.0)
+    
+    # Branchless form: f(n) = l - a * clamp(min(k - 3, 9 - k), -1, 1), k = (n + 12h) mod 12
+    a = s * np.minimum(l, 1.0 - l)
+    k = (np.array([0.0, 8.0, 4.0], dtype=np.float32) + h * 12.0) % 12.0
+    rgb = l - a * np.clip(np.minimum(k - 3.0, 9.0 - k), -1.0, 1.0)
+    return np.clip(rgb, 0.0, 1.0, out=rgb)
+
+
+class SceneArrays:
+    """Structure-of-arrays storage for per-object transform and color data.
+    
+    Rows are handed out by allocate() and grow by doubling, so batch passes
+    over the scene scan contiguous columns instead of SceneObject instances.
+    """
+    
+    def __init__(self, capacity: int = 16):
+        """Initialize empty columns.
+        
+        Args:
+            capacity: Initial number of rows
+        """
+        self.count = 0
+        self.version = 0  # bumped whenever an attached object changes
+        self.positions = np.zeros((capacity, 3), dtype=np.float32)
+        self.rotations = np.zeros((capacity, 3), dtype=np.float32)  # Euler degrees
+        self.scales = np.ones((capacity, 3), dtype=np.float32)
+        self.colors = np.ones((capacity, 3), dtype=np.float32)
+    
+    def allocate(self) -> int:
+        """Reserve the next row, growing the columns if full.
+        
+        Returns:
+            Row index
+        """
+        if self.count == len(self.positions):
+            capacity = max(1, 2 * self.count)
+            self.positions = self._grow(self.positions, capacity, 0.0)
+            self.rotations = self._grow(self.rotations, capacity, 0.0)
+            self.scales = self._grow(self.scales, capacity, 1.0)
+            self.colors = self._grow(self.colors, capacity, 1.0)
+        self.count += 1
+        return self.count - 1
+    
+    @staticmethod
+    def _grow(column: np.ndarray, capacity: int, fill: float) -> np.ndarray:
+        grown = np.full((capacity, column.shape[1]), fill, dtype=column.dtype)
+        grown[:len(column)] = column
+        return grown
+
 
 class SceneObject:
-    """Represents a single 3D object in the scene."""
+    """Represents a single 3D object in the scene.
+    
+    Change objects through apply_transform/apply_material. After assigning
+    attributes directly, call mark_dirty() to publish them to the scene.
+    """
+    
+    __slots__ = (
+        "obj_id", "obj_type",
+        "position", "rotation", "scale",
+        "color", "metallic", "roughness", "emission",
+        "visible", "cast_shadow", "receive_shadow",
+        "_arrays", "_row", "_dict_cache", "_dirty"
+    )
     
     def __init__(self, obj_id: str, obj_type: str = "cube"):
         """Initialize a scene object.
@@ -34,6 +161,43 @@ class SceneObject:
         self.visible = True
         self.cast_shadow = True
         self.receive_shadow = True
+        
+        # Row in the owning SceneGraph's SceneArrays, set by add_object
+        self._arrays: SceneArrays | None = None
+        self._row = -1
+        
+        # Cached to_dict() result, rebuilt after any public attribute changes
+        self._dict_cache: dict | None = None
+        self._dirty = True
+    
+    def mark_dirty(self) -> None:
+        """Publish direct attribute writes: copy them into the scene row and invalidate to_dict()."""
+        self._touch()
+        self._sync_transform()
+        self._sync_material()
+    
+    def _touch(self) -> None:
+        """Invalidate the cached to_dict() and the scene's render command."""
+        self._dirty = True
+        if self._arrays is not None:
+            self._arrays.version += 1
+    
+    def _attach(self, arrays: SceneArrays, row: int) -> None:
+        """Bind object to a SceneArrays row and copy its current state in."""
+        self._arrays = arrays
+        self._row = row
+        self._sync_transform()
+        self._sync_material()
+    
+    def _sync_transform(self) -> None:
+        if self._arrays is not None:
+            self._arrays.positions[self._row] = self.position
+            self._arrays.rotations[self._row] = self.rotation
+            self._arrays.scales[self._row] = self.scale
+    
+    def _sync_material(self) -> None:
+        if self._arrays is not None:
+            self._arrays.colors[self._row] = self.color
     
     def apply_transform(self, position: tuple = None, rotation: tuple = None, scale: tuple = None) -> None:
         """Apply transformation to object.
@@ -49,6 +213,8 @@ class SceneObject:
             self.rotation = rotation
         if scale is not None:
             self.scale = scale
+        self._touch()
+        self._sync_transform()
     
     def apply_material(self, color: tuple = None, metallic: float = None, roughness: float = None, emission: tuple = None) -> None:
         """Apply material properties to object.
@@ -62,15 +228,22 @@ class SceneObject:
         if color is not None:
             self.color = color
         if metallic is not None:
-            self.metallic = max(0.0, min(1.0, metallic))
+            self.metallic = 0.0 if metallic < 0.0 else (1.0 if metallic > 1.0 else metallic)
         if roughness is not None:
-            self.roughness = max(0.0, min(1.0, roughness))
+            self.roughness = 0.0 if roughness < 0.0 else (1.0 if roughness > 1.0 else roughness)
         if emission is not None:
             self.emission = emission
+        self._touch()
+        self._sync_material()
     
     def to_dict(self) -> dict:
-        """Convert object to dictionary representation."""
-        return {
+        """Convert object to dictionary representation.
+        
+        The dict is cached until the object changes; treat it as read-only.
+        """
+        if not self._dirty:
+            return self._dict_cache
+        self._dict_cache = {
             "id": self.obj_id,
             "type": self.obj_type,
             "transform": {
@@ -90,6 +263,8 @@ class SceneObject:
                 "receive_shadow": self.receive_shadow
             }
         }
+        self._dirty = False
+        return self._dict_cache
 
 
 class SceneGraph:
@@ -100,6 +275,17 @@ class SceneGraph:
         self.objects: dict[str, SceneObject] = {}
         self.lights: dict[str, dict] = {}
         self.update_count = 0
+        
+        # Transform/color columns shared by all objects, indexed by obj_id
+        self.arrays = SceneArrays()
+        self.index: dict[str, int] = {}
+        
+        # Last render command and the (update_count, arrays.version) it was built for
+        self._render_cache: dict | None = None
+        self._render_key = (-1, -1)
+        
+        # HSL colors awaiting one batched conversion: obj_id -> (h, s, l) in [0, 1]
+        self._pending_hsl: dict[str, tuple] = {}
     
     def add_object(self, obj: SceneObject) -> None:
         """Add object to scene.
@@ -107,6 +293,10 @@ class SceneGraph:
         Args:
             obj: SceneObject to add
         """
+        row = self.index.get(obj.obj_id)
+        if row is None:
+            row = self.index[obj.obj_id] = self.arrays.allocate()
+        obj._attach(self.arrays, row)
         self.objects[obj.obj_id] = obj
         self.update_count += 1
     
@@ -121,6 +311,35 @@ class SceneGraph:
         """
         return self.objects.get(obj_id)
     
+    def queue_hsl(self, obj_id: str, h: float, s: float, l: float) -> None:
+        """Queue an HSL color for an object, converted on the next flush_colors().
+        
+        Args:
+            obj_id: Object identifier
+            h: Hue in [0, 1], wrapped
+            s: Saturation, clamped to [0, 1]
+            l: Lightness, clamped to [0, 1]
+        """
+        s = 0.0 if s < 0.0 else (1.0 if s > 1.0 else s)
+        l = 0.0 if l < 0.0 else (1.0 if l > 1.0 else l)
+        self._pending_hsl[obj_id] = (h % 1.0, s, l)
+    
+    def discard_hsl(self, obj_id: str) -> None:
+        """Drop any queued HSL color for an object."""
+        self._pending_hsl.pop(obj_id, None)
+    
+    def flush_colors(self) -> None:
+        """Convert all queued HSL colors in one batch and apply them to their objects."""
+        if not self._pending_hsl:
+            return
+        obj_ids = list(self._pending_hsl)
+        rgb = hsl_to_rgb(np.array(list(self._pending_hsl.values()), dtype=np.float32))
+        self._pending_hsl.clear()
+        for obj_id, color in zip(obj_ids, rgb.tolist()):
+            obj = self.objects.get(obj_id)
+            if obj is not None:
+                obj.apply_material(color=tuple(color))
+    
     def add_light(self, light_id: str, light_type: str = "directional", position: tuple = (0, 0, 0), color: tuple = (1, 1, 1), intensity: float = 1.0) -> None:
         """Add light to scene.
         
@@ -139,17 +358,66 @@ class SceneGraph:
         }
         self.update_count += 1
     
+    def compute_world_matrices(self) -> np.ndarray:
+        """Build every object's world matrix T * R * S in one vectorized pass.
+        
+        Uses a parallel Numba kernel when numba is installed.
+        
+        Rotation uses XYZ Euler order in degrees (R = Rx * Ry * Rz), matching
+        three.js. Matrices act on column vectors, indexed [row, col].
+        
+        Returns:
+            (N, 4, 4) float32 array, rows in self.index order
+        """
+        n = self.arrays.count
+        if _build_world_matrices is not None:
+            matrices = np.empty((n, 4, 4), dtype=np.float32)
+            _build_world_matrices(self.arrays.positions[:n], self.arrays.rotations[:n],
+                                  self.arrays.scales[:n], matrices)
+            return matrices
+        
+        rx, ry, rz = np.radians(self.arrays.rotations[:n]).T
+        cx, cy, cz = np.cos(rx), np.cos(ry), np.cos(rz)
+        sx, sy, sz = np.sin(rx), np.sin(ry), np.sin(rz)
+        
+        matrices = np.zeros((n, 4, 4), dtype=np.float32)
+        matrices[:, 0, 0] = cy * cz
+        matrices[:, 0, 1] = -cy * sz
+        matrices[:, 0, 2] = sy
+        matrices[:, 1, 0] = cx * sz + sx * sy * cz
+        matrices[:, 1, 1] = cx * cz - sx * sy * sz
+        matrices[:, 1, 2] = -sx * cy
+        matrices[:, 2, 0] = sx * sz - cx * sy * cz
+        matrices[:, 2, 1] = sx * cz + cx * sy * sz
+        matrices[:, 2, 2] = cx * cy
+        
+        # Scale columns, then translate
+        matrices[:, :3, :3] *= self.arrays.scales[:n, None, :]
+        matrices[:, :3, 3] = self.arrays.positions[:n]
+        matrices[:, 3, 3] = 1.0
+        return matrices
+    
     def get_render_command(self) -> dict:
         """Get complete render command for current scene state.
         
+        Queued HSL colors are flushed first. Unchanged frames return the
+        previous command object as-is.
+        
         Returns:
             Dictionary with all objects and lights ready for rendering
         """
-        return {
+        self.flush_colors()
+        key = (self.update_count, self.arrays.version)
+        if key == self._render_key:
+            return self._render_cache
+        
+        self._render_cache = {
             "objects": [obj.to_dict() for obj in self.objects.values()],
             "lights": list(self.lights.values()),
             "update_count": self.update_count
         }
+        self._render_key = key
+        return self._render_cache
 
 
 class OrchestratorRenderBridge:
@@ -161,6 +429,34 @@ class OrchestratorRenderBridge:
         self.object_sources: dict[str, str] = {}  # obj_id -> source orchestrator input
         self.total_renders = 0
     
+    def _apply_color(self, obj: SceneObject, color) -> None:
+        """Apply an orchestrator color: RGB now, HSL queued on the scene.
+        
+        Accepts (r, g, b) tuples, "#rrggbb", "hsl(h, s%, l%)" strings, and
+        {"h", "s", "l"} dicts with components in [0, 1]. Any color that is
+        not HSL, including an unrecognized string, drops a queued HSL color
+        so it cannot be applied later over a newer update.
+        """
+        if isinstance(color, dict):
+            self.scene.queue_hsl(obj.obj_id, color.get("h", 0.5), color.get("s", 0.5), color.get("l", 0.5))
+            return
+        if isinstance(color, str):
+            match = _HSL_PATTERN.fullmatch(color.strip())
+            if match:
+                h, s, l = (float(v) for v in match.groups())
+                self.scene.queue_hsl(obj.obj_id, h / 360.0, s / 100.0, l / 100.0)
+                return
+            self.scene.discard_hsl(obj.obj_id)
+            if color.startswith("#") and len(color) == 7:
+                obj.apply_material(color=tuple(int(color[i:i + 2], 16) / 255.0 for i in (1, 3, 5)))
+        elif color is not None:
+            self.scene.discard_hsl(obj.obj_id)
+            obj.apply_material(color=tuple(color))
+    
+    def flush_colors(self) -> None:
+        """Convert all queued HSL colors in one batch (see SceneGraph.flush_colors)."""
+        self.scene.flush_colors()
+    
     def create_object_from_orchestrator(self, obj_id: str, orchestrator_state: dict, obj_type: str = "cube") -> SceneObject:
         """Create a new scene object configured by orchestrator state.
         
@@ -175,7 +471,7 @@ class OrchestratorRenderBridge:
         obj = SceneObject(obj_id, obj_type)
         
         # Extract render transforms
-        render_transforms = orchestrator_state.get("render_transforms", {})
+        render_transforms = orchestrator_state.get("render_transforms") or _EMPTY
         position = render_transforms.get("position", (0, 0, 0))
         rotation = render_transforms.get("rotation", (0, 0, 0))
         scale = render_transforms.get("scale", (1, 1, 1))
@@ -183,25 +479,16 @@ class OrchestratorRenderBridge:
         # Apply transform
         obj.apply_transform(position=position, rotation=rotation, scale=scale)
         
-        # Extract colors from upflow automation
-        colors = orchestrator_state.get("colors", {})
-        primary_color = colors.get("primary", (1, 1, 1))
-        
-        # Convert from HSL to RGB if needed
-        if isinstance(primary_color, dict):
-            # HSL format: apply as-is for now (would need HSL->RGB conversion in production)
-            rgb = (primary_color.get("h", 0.5), primary_color.get("s", 0.5), primary_color.get("l", 0.5))
-        else:
-            rgb = primary_color if primary_color else (1, 1, 1)
+        # Add to scene
+        self.scene.add_object(obj)
         
-        obj.apply_material(color=rgb)
+        # Extract colors from upflow automation (HSL is converted in batch on flush)
+        colors = orchestrator_state.get("colors") or _EMPTY
+        self._apply_color(obj, colors.get("primary", (1, 1, 1)))
         
         # Track source
         self.object_sources[obj_id] = orchestrator_state.get("input_text", "")
         
-        # Add to scene
-        self.scene.add_object(obj)
-        
         return obj
     
     def apply_orchestrator_to_object(self, obj_id: str, orchestrator_state: dict) -> None:
@@ -211,14 +498,14 @@ class OrchestratorRenderBridge:
             obj_id: ID of object to update
             orchestrator_state: New orchestrator state
         """
-        obj = self.scene.get_object(obj_id)
+        obj = self.scene.objects.get(obj_id)
         if not obj:
             # Create if doesn't exist
             self.create_object_from_orchestrator(obj_id, orchestrator_state)
             return
         
         # Extract and apply render transforms
-        render_transforms = orchestrator_state.get("render_transforms", {})
+        render_transforms = orchestrator_state.get("render_transforms") or _EMPTY
         if render_transforms:
             position = render_transforms.get("position", obj.position)
             rotation = render_transforms.get("rotation", obj.rotation)
@@ -226,18 +513,54 @@ class OrchestratorRenderBridge:
             obj.apply_transform(position=position, rotation=rotation, scale=scale)
         
         # Extract and apply colors
-        colors = orchestrator_state.get("colors", {})
-        if colors:
-            primary_color = colors.get("primary", obj.color)
-            if isinstance(primary_color, dict):
-                rgb = (primary_color.get("h", 0.5), primary_color.get("s", 0.5), primary_color.get("l", 0.5))
-            else:
-                rgb = primary_color
-            obj.apply_material(color=rgb)
+        colors = orchestrator_state.get("colors") or _EMPTY
+        if "primary" in colors:
+            self._apply_color(obj, colors["primary"])
         
         # Update source
         self.object_sources[obj_id] = orchestrator_state.get("input_text", "")
     
+    def apply_orchestrator_batch(self, updates: list[tuple[str, dict]]) -> None:
+        """Apply many orchestrator states in one pass.
+        
+        Equivalent to calling apply_orchestrator_to_object per update, but the
+        transforms of existing objects are written to the scene's SoA columns
+        with one fancy-indexed assignment per column.
+        
+        Args:
+            updates: (obj_id, orchestrator_state) pairs, applied in order
+        """
+        rows, positions, rotations, scales = [], [], [], []
+        for obj_id, orchestrator_state in updates:
+            obj = self.scene.objects.get(obj_id)
+            if not obj:
+                self.create_object_from_orchestrator(obj_id, orchestrator_state)
+                continue
+            
+            # Object attributes now, array rows once after the loop
+            render_transforms = orchestrator_state.get("render_transforms") or _EMPTY
+            if render_transforms:
+                obj.position = render_transforms.get("position", obj.position)
+                obj.rotation = render_transforms.get("rotation", obj.rotation)
+                obj.scale = render_transforms.get("scale", obj.scale)
+                obj._touch()
+                rows.append(self.scene.index[obj_id])
+                positions.append(obj.position)
+                rotations.append(obj.rotation)
+                scales.append(obj.scale)
+            
+            colors = orchestrator_state.get("colors") or _EMPTY
+            if "primary" in colors:
+                self._apply_color(obj, colors["primary"])
+            
+            self.object_sources[obj_id] = orchestrator_state.get("input_text", "")
+        
+        if rows:
+            arrays = self.scene.arrays
+            arrays.positions[rows] = positions
+            arrays.rotations[rows] = rotations
+            arrays.scales[rows] = scales
+    
     def get_render_command(self) -> dict:
         """Get current render command from scene.
         
@@ -250,21 +573,23 @@ class OrchestratorRenderBridge:
     def get_system_status(self) -> dict:
         """Get overall graphics system status.
         
+        Per-object fields are columnar: "objects" holds parallel lists read
+        straight from the scene's SoA arrays.
+        
         Returns:
             Status dictionary
         """
+        self.flush_colors()
+        arrays = self.scene.arrays
         return {
             "total_objects": len(self.scene.objects),
             "total_lights": len(self.scene.lights),
             "total_renders": self.total_renders,
             "scene_updates": self.scene.update_count,
-            "objects": [
-                {
-                    "id": obj.obj_id,
-                    "type": obj.obj_type,
-                    "position": obj.position,
-                    "color": obj.color
-                }
-                for obj in self.scene.objects.values()
-            ]
+            "objects": {
+                "ids": list(self.scene.objects),
+                "types": [obj.obj_type for obj in self.scene.objects.values()],
+                "positions": arrays.positions[:arrays.count].tolist(),
+                "colors": arrays.colors[:arrays.count].tolist()
+            }
         }
@@ -8,18 +8,85 @@ Enables self-correcting orchestration through feedback cycles:
 5. History tracked for analysis
 """
 
+from __future__ import annotations
+
+import asyncio
+import logging
+import operator
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+
 from meta.orchestrator_v2 import MetaOrchestrator
 
+logger = logging.getLogger(__name__)
+
+# Verbose loops report here: always INFO to stderr, independent of how the
+# application configures the module logger used by quiet loops
+_verbose_logger = logger.getChild("verbose")
+_verbose_logger.setLevel(logging.INFO)
+_verbose_logger.addHandler(logging.StreamHandler())
+_verbose_logger.propagate = False
+
+# Decision → action verb
+ACTION_MAP = MappingProxyType({
+    "aggressive": "amplify",
+    "balanced": "adjust",
+    "gentle": "refine"
+})
+# (adjective, comparison, threshold) for embeddings[0], [1], [2]
+ADJ_RULES = (
+    ("intense", operator.gt, 0.7),
+    ("dynamic", operator.gt, 0.6),
+    ("subtle", operator.lt, 0.3),
+)
+MASS_NAMES = ("light", "medium", "heavy")
+VELOCITY_NAMES = ("low-speed", "moderate-speed", "high-speed")
+
+
+@lru_cache(maxsize=1024)
+def _feedback_text(decision: str, embeddings: tuple, mass: float, vel_mag: float) -> str:
+    """Build feedback text from the state values outputs_to_text reads."""
+    action = ACTION_MAP.get(decision, "process")
+    
+    # Embeddings → adjectives; zip stops at however many embeddings exist
+    adjectives = [name for (name, cmp, threshold), e in zip(ADJ_RULES, embeddings) if cmp(e, threshold)]
+    
+    # Physics → numeric descriptor; bucket 1 (medium) also catches NaN as the ladder did
+    mass_desc = MASS_NAMES[(not mass < 0.5) + (mass > 2.0)]
+    vel_desc = VELOCITY_NAMES[(not vel_mag < 1.0) + (vel_mag > 3.0)]
+    
+    # Build feedback text
+    adj_str = " ".join(adjectives) if adjectives else "balanced"
+    return f"{action} {adj_str} {mass_desc} {vel_desc} system with physics"
+
+
+def _run_one(max_cycles: int, early_exit: bool, initial_input: str) -> dict:
+    """Worker entry point for run_many; each process uses its own shared orchestrator."""
+    return FeedbackLoop(max_cycles=max_cycles, early_exit=early_exit).run_feedback_loop(initial_input)
+
 
 class FeedbackLoop:
     """Manages recursive orchestration feedback cycles."""
     
-    def __init__(self, max_cycles: int = 5):
-        self.orchestrator = MetaOrchestrator()
+    # Built on first use and reused by every loop not given its own orchestrator
+    _shared_orchestrator: MetaOrchestrator | None = None
+    
+    def __init__(self, max_cycles: int = 5, verbose: bool = False, early_exit: bool = True,
+                 orchestrator: MetaOrchestrator | None = None):
+        if orchestrator is None:
+            if FeedbackLoop._shared_orchestrator is None:
+                FeedbackLoop._shared_orchestrator = MetaOrchestrator()
+            orchestrator = FeedbackLoop._shared_orchestrator
+        self.orchestrator = orchestrator
         self.max_cycles = max_cycles
+        self.early_exit = early_exit
         self.history: list[dict] = []
         self.current_cycle = 0
         
+        # Cycle reports go through logging at INFO; verbose loops print them to stderr
+        self.log = _verbose_logger if verbose else logger
+        
     def outputs_to_text(self, state: dict) -> str:
         """Convert orchestrator outputs back to text for feedback.
         
@@ -32,50 +99,13 @@ class FeedbackLoop:
         decision = state.get("decision", "balanced")
         embeddings = state.get("embeddings", [])
         physics_params = state.get("physics_params", {})
-        colors = state.get("colors", {})
         
-        # Decision → action verb
-        action_map = {
-            "aggressive": "amplify",
-            "balanced": "adjust",
-            "gentle": "refine"
-        }
-        action = action_map.get(decision, "process")
-        
-        # Embeddings → adjectives (first 3)
-        adjectives = []
-        if embeddings:
-            if embeddings[0] > 0.7:
-                adjectives.append("intense")
-            if embeddings[1] > 0.6 if len(embeddings) > 1 else False:
-                adjectives.append("dynamic")
-            if embeddings[2] < 0.3 if len(embeddings) > 2 else False:
-                adjectives.append("subtle")
-        
-        # Physics → numeric descriptor
         mass = physics_params.get("mass", 1.0)
         velocity = physics_params.get("velocity", (1.0,))
         vel_mag = velocity[0] if isinstance(velocity, (tuple, list)) else velocity
         
-        if mass > 2.0:
-            mass_desc = "heavy"
-        elif mass < 0.5:
-            mass_desc = "light"
-        else:
-            mass_desc = "medium"
-        
-        if vel_mag > 3.0:
-            vel_desc = "high-speed"
-        elif vel_mag < 1.0:
-            vel_desc = "low-speed"
-        else:
-            vel_desc = "moderate-speed"
-        
-        # Build feedback text
-        adj_str = " ".join(adjectives) if adjectives else "balanced"
-        feedback_text = f"{action} {adj_str} {mass_desc} {vel_desc} system with physics"
-        
-        return feedback_text
+        # Only these inputs reach the text, so converged cycles hit the cache
+        return _feedback_text(decision, tuple(embeddings[:3]), mass, vel_mag)
     
     def run_feedback_loop(self, initial_input: str) -> dict:
         """Execute recursive feedback cycles.
@@ -85,18 +115,20 @@ class FeedbackLoop:
             
         Returns:
             Dictionary with cycle history and convergence analysis
+        
+        The orchestrator may be shared, so its vault, pipeline and logs are left
+        alone; cycle results depend only on its token lab and rules.
         """
-        print("\n" + "=" * 80)
-        print(f"FEEDBACK LOOP: {self.max_cycles} CYCLES")
-        print("=" * 80)
+        self.log.info("\n%s\nFEEDBACK LOOP: %d CYCLES\n%s", "=" * 80, self.max_cycles, "=" * 80)
         
         current_input = initial_input
+        converged_streak = 0
+        early_exit_cycle = None
         
         for cycle_num in range(self.max_cycles):
             self.current_cycle = cycle_num + 1
             
-            print(f"\n[CYCLE {self.current_cycle}]")
-            print(f"  Input: {current_input}")
+            self.log.info("\n[CYCLE %d]\n  Input: %s", self.current_cycle, current_input)
             
             # Orchestrate
             state = self.orchestrator.orchestrate(current_input)
@@ -112,54 +144,100 @@ class FeedbackLoop:
             }
             self.history.append(cycle_record)
             
-            print(f"  Decision: {cycle_record['decision']}")
+            self.log.info("  Decision: %s", cycle_record["decision"])
             
             # Calculate feedback for next cycle
             if cycle_num < self.max_cycles - 1:
+                prev_input = current_input
                 current_input = self.outputs_to_text(state)
             else:
-                print(f"  [FINAL CYCLE - No feedback generated]")
+                self.log.info("  [FINAL CYCLE - No feedback generated]")
+                break
+            
+            # A fixed point (same input, same decision) repeats identically from here on
+            if (current_input == prev_input and len(self.history) > 1
+                    and cycle_record["decision"] == self.history[-2]["decision"]):
+                converged_streak += 1
+            else:
+                converged_streak = 0
+            if self.early_exit and converged_streak >= 2:
+                early_exit_cycle = self.current_cycle
+                self.log.info("  [FIXED POINT - Stopping early after cycle %d]", early_exit_cycle)
+                break
         
         # Analyze convergence
         decisions = [h["decision"] for h in self.history]
         unique_decisions = len(set(decisions))
         
-        print(f"\n" + "-" * 80)
-        print("CONVERGENCE ANALYSIS")
-        print("-" * 80)
-        print(f"  Total cycles: {len(self.history)}")
-        print(f"  Unique decisions: {unique_decisions}")
-        print(f"  Decision sequence: {' → '.join(decisions)}")
-        
         if unique_decisions == 1:
-            print(f"  Status: ✓ CONVERGED to '{decisions[0]}'")
             convergence = "converged"
+            status = f"✓ CONVERGED to '{decisions[0]}'"
         elif unique_decisions == len(decisions):
-            print(f"  Status: ✗ DIVERGING (all different)")
             convergence = "diverging"
+            status = "✗ DIVERGING (all different)"
         else:
-            print(f"  Status: ~ OSCILLATING ({unique_decisions} states)")
             convergence = "oscillating"
+            status = f"~ OSCILLATING ({unique_decisions} states)"
         
-        # Physics parameter evolution
-        print(f"\n  Physics evolution:")
-        for i, record in enumerate(self.history, 1):
-            vel = record["velocity"]
-            vel_mag = vel[0] if isinstance(vel, (tuple, list)) else vel
-            print(f"    Cycle {i}: mass={record['mass']:.3f}, velocity={vel_mag:.3f} m/s")
+        self.log.info(
+            "\n%s\nCONVERGENCE ANALYSIS\n%s\n  Total cycles: %d\n  Unique decisions: %d\n"
+            "  Decision sequence: %s\n  Status: %s",
+            "-" * 80, "-" * 80, len(self.history), unique_decisions,
+            " → ".join(decisions), status
+        )
+        
+        # Physics parameter evolution, emitted as one record
+        if self.log.isEnabledFor(logging.INFO):
+            lines = ["\n  Physics evolution:"]
+            for i, record in enumerate(self.history, 1):
+                vel = record["velocity"]
+                vel_mag = vel[0] if isinstance(vel, (tuple, list)) else vel
+                lines.append(f"    Cycle {i}: mass={record['mass']:.3f}, velocity={vel_mag:.3f} m/s")
+            self.log.info("\n".join(lines))
         
         return {
             "history": self.history,
             "convergence": convergence,
             "final_decision": decisions[-1],
             "unique_decisions": unique_decisions,
+            "early_exit_cycle": early_exit_cycle,
         }
 
+    
+    async def run_many_async(self, inputs: list[str], max_workers: int | None = None) -> list[dict]:
+        """Run one independent feedback loop per input across a process pool.
+        
+        Orchestration is CPU-bound Python, so loops are spread over processes rather
+        than threads. Results come back in input order; self.history is untouched.
+        
+        Each worker process runs its loops on its own default MetaOrchestrator,
+        so this is only available on loops built without an orchestrator.
+        
+        Raises:
+            ValueError: If this loop was given its own orchestrator
+        """
+        if self.orchestrator is not FeedbackLoop._shared_orchestrator:
+            raise ValueError("run_many uses each worker's default orchestrator; "
+                             "construct the FeedbackLoop without orchestrator=")
+        loop = asyncio.get_running_loop()
+        
+        async def run_in_pool(pool: ProcessPoolExecutor, text: str) -> dict:
+            return await loop.run_in_executor(pool, _run_one, self.max_cycles, self.early_exit, text)
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(run_in_pool(pool, text)) for text in inputs]
+        return [task.result() for task in tasks]
+    
+    def run_many(self, inputs: list[str], max_workers: int | None = None) -> list[dict]:
+        """Blocking wrapper around run_many_async (same restrictions)."""
+        return asyncio.run(self.run_many_async(inputs, max_workers))
+
 
 def demo_feedback_loop():
     """Demonstrate recursive feedback loop."""
     
-    loop = FeedbackLoop(max_cycles=5)
+    loop = FeedbackLoop(max_cycles=5, verbose=True)
     
     result = loop.run_feedback_loop("aggressive physics simulation")
     
@@ -1,9 +1,16 @@
 from __future__ import annotations
 import json
-from dataclasses import dataclass, field, asdict
+import time
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; export_manifest falls back to the stdlib encoder
+    orjson = None
+
 
 import json
 
@@ -13,22 +20,41 @@ class EnumEncoder(json.JSONEncoder):
             return obj.value
         return super().default(obj)
 
+def _orjson_default(obj):
+    if hasattr(obj, 'value'):
+        return obj.value
+    raise TypeError
+
+def _fmt_ts(ts: float) -> str:
+    """Format a stored time.time() stamp; only called when a manifest is built."""
+    return datetime.fromtimestamp(ts).isoformat()
+
 class ComplianceLevel(Enum):
     CRITICAL = "critical"
     WARNING = "warning"
     INFO = "info"
     OK = "ok"
 
-@dataclass
+@dataclass(slots=True)
 class SystemStatus:
     name: str
     status: str
-    timestamp: str
+    timestamp: float
     compliance: str
     cycle_count: int
     details: dict = field(default_factory=dict)
 
-@dataclass
+    def to_dict(self) -> dict:
+        return {
+            'name': self.name,
+            'status': self.status,
+            'timestamp': _fmt_ts(self.timestamp),
+            'compliance': self.compliance,
+            'cycle_count': self.cycle_count,
+            'details': dict(self.details),
+        }
+
+@dataclass(slots=True)
 class ExecutionMetrics:
     total_cycles: int = 0
     tokens_processed: int = 0
@@ -38,18 +64,35 @@ class ExecutionMetrics:
     renders_output: int = 0
     total_runtime_ms: float = 0.0
 
+    _FIELDS = (
+        'total_cycles', 'tokens_processed', 'embeddings_generated', 'decisions_made',
+        'physics_simulations', 'renders_output', 'total_runtime_ms',
+    )
+
+    def to_dict(self) -> dict:
+        return {name: getattr(self, name) for name in self._FIELDS}
+
 class ManifestRegistry:
-    def __init__(self):
+    def __init__(self, max_history: int = 1024):
         self.systems = {}
         self.metrics = ExecutionMetrics()
-        self.manifest_history = []
+        self.max_history = max_history
+        self.manifest_history = deque(maxlen=max_history)
         self.active_workflows = []
+        self._metric_dispatch = {
+            'tokens_processed': 'tokens_processed',
+            'embeddings_generated': 'embeddings_generated',
+            'decisions_made': 'decisions_made',
+            'physics_simulations': 'physics_simulations',
+            'renders_output': 'renders_output',
+            'cycles': 'total_cycles',
+        }
 
     def register_system(self, name: str, initial_status: str = "initialized"):
         self.systems[name] = SystemStatus(
             name=name,
             status=initial_status,
-            timestamp=datetime.now().isoformat(),
+            timestamp=time.time(),
             compliance=ComplianceLevel.OK.value,
             cycle_count=0
         )
@@ -59,7 +102,7 @@ class ManifestRegistry:
             self.register_system(name, status)
         else:
             self.systems[name].status = status
-            self.systems[name].timestamp = datetime.now().isoformat()
+            self.systems[name].timestamp = time.time()
             self.systems[name].cycle_count += 1
             if details:
                 self.systems[name].details = details
@@ -67,23 +110,14 @@ class ManifestRegistry:
                 self.systems[name].compliance = compliance
 
     def log_metric(self, metric_name: str, value: int = 1):
-        if metric_name == 'tokens_processed':
-            self.metrics.tokens_processed += value
-        elif metric_name == 'embeddings_generated':
-            self.metrics.embeddings_generated += value
-        elif metric_name == 'decisions_made':
-            self.metrics.decisions_made += value
-        elif metric_name == 'physics_simulations':
-            self.metrics.physics_simulations += value
-        elif metric_name == 'renders_output':
-            self.metrics.renders_output += value
-        elif metric_name == 'cycles':
-            self.metrics.total_cycles += value
+        attr = self._metric_dispatch.get(metric_name)
+        if attr:
+            setattr(self.metrics, attr, getattr(self.metrics, attr) + value)
 
     def start_workflow(self, workflow_id: str, input_data: dict):
         self.active_workflows.append({
             'id': workflow_id,
-            'started_at': datetime.now().isoformat(),
+            'started_at': time.time(),
             'input': input_data,
             'status': 'running'
         })
@@ -92,20 +126,26 @@ class ManifestRegistry:
         for wf in self.active_workflows:
             if wf['id'] == workflow_id:
                 wf['status'] = 'completed'
-                wf['completed_at'] = datetime.now().isoformat()
+                wf['completed_at'] = time.time()
                 wf['output'] = output_data
                 wf['runtime_ms'] = runtime_ms
                 self.metrics.total_runtime_ms += runtime_ms
                 break
 
     def create_manifest(self) -> dict:
+        active = completed = 0
+        for wf in self.active_workflows:
+            if wf['status'] == 'running':
+                active += 1
+            elif wf['status'] == 'completed':
+                completed += 1
         manifest = {
             'version': '1.0',
             'timestamp': datetime.now().isoformat(),
-            'systems': {name: asdict(status) for name, status in self.systems.items()},
-            'metrics': asdict(self.metrics),
-            'active_workflows': len([wf for wf in self.active_workflows if wf['status'] == 'running']),
-            'completed_workflows': len([wf for wf in self.active_workflows if wf['status'] == 'completed']),
+            'systems': {name: status.to_dict() for name, status in self.systems.items()},
+            'metrics': self.metrics.to_dict(),
+            'active_workflows': active,
+            'completed_workflows': completed,
             'overall_compliance': self._calculate_overall_compliance()
         }
         self.manifest_history.append(manifest)
@@ -126,11 +166,26 @@ class ManifestRegistry:
     def get_manifest(self) -> dict:
         return self.create_manifest()
 
+    @staticmethod
+    def _write_json(obj, filepath: str):
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(obj, default=_orjson_default, option=option))
+        else:
+            with open(filepath, 'w') as f:
+                json.dump(obj, f, indent=2, cls=EnumEncoder)
+
     def export_manifest(self, filepath: str):
         manifest = self.create_manifest()
-        with open(filepath, 'w') as f:
-            json.dump(manifest, f, indent=2, cls=EnumEncoder)
+        self._write_json(manifest, filepath)
         print(f"[MANIFEST] Exported to {filepath}")
 
+    def dump_history(self, filepath: str) -> int:
+        """Write the buffered manifest history to filepath and start a fresh buffer."""
+        history, self.manifest_history = self.manifest_history, deque(maxlen=self.max_history)
+        self._write_json(list(history), filepath)
+        return len(history)
+
     def get_system_health(self) -> dict:
         return {name: s.compliance for name, s in self.systems.items()}
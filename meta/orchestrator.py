@@ -1,5 +1,6 @@
 from __future__ import annotations
 import json
+import time
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
@@ -14,7 +15,7 @@ class PipelineZone(Enum):
     SYNTHETIC_REBUILD = "SYNTHETIC_REBUILD"
     ACTIONABLE_OUTPUT = "ACTIONABLE_OUTPUT"
 
-@dataclass
+@dataclass(slots=True)
 class PipelineState:
     current_zone: PipelineZone
     cycle_count: int = 0
@@ -25,7 +26,11 @@ class PipelineState:
     render_transforms: list = field(default_factory=list)
     compliance_status: str = "ready"
     manifest: dict = field(default_factory=dict)
-    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def iso_timestamp(self) -> str:
+        return datetime.fromtimestamp(self.timestamp).isoformat()
 
 class MetaLibrarianOrchestrator:
     def __init__(self):
@@ -52,7 +57,7 @@ class MetaLibrarianOrchestrator:
         prev_zone = self.state.current_zone
         self.state.current_zone = next_zone
         self.state.cycle_count += 1
-        self.state.timestamp = datetime.now().isoformat()
+        self.state.timestamp = time.time()
         print(f"[ORCH] Cycle {self.state.cycle_count}: {prev_zone.value} -> {next_zone.value}")
         if next_zone in self.zone_handlers:
             try:
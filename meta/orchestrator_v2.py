@@ -11,29 +11,35 @@ Unified orchestration layer coordinating:
 """
 
 from __future__ import annotations
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum
 
+import bisect
 import json
+import logging
+import sys
 import time
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
+
+import numpy as np
+
+from meta.manifest import ComplianceLevel
+from meta.orchestrator import PipelineZone
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; reconstruction falls back to NumPy
+    njit = None
+
+logger = logging.getLogger(__name__)
 
 # ============================================================================
 # ZONE HIERARCHY & PIPELINE ORCHESTRATION
 # ============================================================================
 
-class PipelineZone(Enum):
-    """8-stage meta-librarian pipeline zones"""
-    HEAD = "HEAD"
-    ROOT_EXTRACTION = "ROOT_EXTRACTION"
-    CONTEXT_STRIPPING = "CONTEXT_STRIPPING"
-    AXIOMATIC_MAPPING = "AXIOMATIC_MAPPING"
-    RELATIONSHIP_WEAVING = "RELATIONSHIP_WEAVING"
-    PATTERN_RECOGNITION = "PATTERN_RECOGNITION"
-    SYNTHETIC_REBUILD = "SYNTHETIC_REBUILD"
-    ACTIONABLE_OUTPUT = "ACTIONABLE_OUTPUT"
-
 class SystemRole(Enum):
     """System roles in the orchestrator"""
     TOKEN_LAB = "token_lab"
@@ -44,28 +50,30 @@ class SystemRole(Enum):
     UPFLOW_AUTOMATION = "upflow_automation"
     CLI_PARSER = "cli_parser"
 
-class ComplianceLevel(Enum):
-    """System compliance tracking"""
-    CRITICAL = "critical"
-    WARNING = "warning"
-    INFO = "info"
-    OK = "ok"
+# (value, role) pairs, resolved once for vault registration
+_SYSTEM_ROLES = tuple((role.value, role) for role in SystemRole)
+
+_DECISIONS = ("aggressive", "balanced", "gentle")
 
 # ============================================================================
 # FIGURE-8 MORPHEME BREAKDOWN/RECONSTRUCTION (TOKEN LAB)
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Morpheme:
     """Atomic word unit with transformation matrix"""
     key: str
-    M: list[list[float]]
-    b: list[float]
+    M: np.ndarray  # (3, 3)
+    b: np.ndarray  # (3,)
     note: str = ""
     effect: str = "linear"
     audio_mapping: dict[str, float] = field(default_factory=dict)
+    
+    def __post_init__(self):
+        self.M = np.asarray(self.M, dtype=np.float64)
+        self.b = np.asarray(self.b, dtype=np.float64)
 
-@dataclass
+@dataclass(slots=True)
 class AtomicBreakdown:
     """Result of morpheme decomposition"""
     token: str
@@ -73,21 +81,55 @@ class AtomicBreakdown:
     mode: str
     timestamp: float = field(default_factory=time.time)
 
-@dataclass
+@dataclass(slots=True)
 class StationaryUnit:
     """Reconstructed state vector from morphemes"""
-    x: list[float]
+    x: np.ndarray
     level: int = 0
     kappa: float = 1.0
     morpheme_trace: list[str] = field(default_factory=list)
 
+if njit is not None:
+    @njit('Tuple((float64[:], float64))(int64[:], float64[:, :, :], float64[:, :])', cache=True)
+    def _reconstruct_kernel(indices, Ms, bs):
+        """Chain x ← M x + b over stacked morpheme transforms; returns (x, kappa)."""
+        x0, x1, x2 = 1.0, 1.0, 1.0
+        kappa = 1.0
+        for k in indices:
+            M = Ms[k]
+            b = bs[k]
+            y0 = M[0, 0] * x0 + M[0, 1] * x1 + M[0, 2] * x2 + b[0]
+            y1 = M[1, 0] * x0 + M[1, 1] * x1 + M[1, 2] * x2 + b[1]
+            y2 = M[2, 0] * x0 + M[2, 1] * x1 + M[2, 2] * x2 + b[2]
+            x0, x1, x2 = y0, y1, y2
+            kappa *= 0.95
+        x = np.empty(3)
+        x[0], x[1], x[2] = x0, x1, x2
+        return x, kappa
+else:
+    _reconstruct_kernel = None
+
 class TokenLab:
     """Figure-8 morpheme system: breakdown (downward) and reconstruction (upward)"""
     
-    def __init__(self):
-        self.morpheme_registry: dict[str, Morpheme] = self._init_morphemes()
+    def __init__(self, cache_limit: int = 4096):
+        # Interned keys let lookups with interned morphemes match on identity
+        self.morpheme_registry: dict[str, Morpheme] = {
+            sys.intern(k): m for k, m in self._init_morphemes().items()
+        }
+        # Bounded caches; the oldest entry is evicted first once full
+        self.cache_limit = cache_limit
         self.breakdown_cache: dict[str, AtomicBreakdown] = {}
-        self.reconstruction_cache: dict[str, StationaryUnit] = {}
+        self.reconstruction_cache: dict[tuple[str, ...], StationaryUnit] = {}
+        self._stack_morphemes()
+    
+    def _stack_morphemes(self) -> None:
+        """Stack registry transforms into (N, 3, 3) / (N, 3) arrays with a key → row map"""
+        self._morpheme_index = {key: i for i, key in enumerate(self.morpheme_registry)}
+        self._Ms = np.stack([m.M for m in self.morpheme_registry.values()])
+        self._bs = np.stack([m.b for m in self.morpheme_registry.values()])
+        # Plain-float copies for the unrolled pure-Python fallback
+        self._linear_rows = {key: (m.M.tolist(), m.b.tolist()) for key, m in self.morpheme_registry.items()}
     
     def _init_morphemes(self) -> dict[str, Morpheme]:
         """Initialize English morpheme registry"""
@@ -131,43 +173,70 @@ class TokenLab:
             morphemes[-1] = morphemes[-1][:-3]
             morphemes.append("-ize")
         
+        morphemes = [sys.intern(m) for m in morphemes]
         result = AtomicBreakdown(token=word, morphemes=morphemes, mode="english")
+        if len(self.breakdown_cache) >= self.cache_limit:
+            del self.breakdown_cache[next(iter(self.breakdown_cache))]
         self.breakdown_cache[word] = result
         return result
     
     def reconstruct(self, breakdown: AtomicBreakdown) -> StationaryUnit:
         """Reconstruct state from morphemes (upward pass)"""
-        cache_key = breakdown.token
+        # Keyed by morphemes: tokens that break down alike share a reconstruction
+        cache_key = tuple(breakdown.morphemes)
         if cache_key in self.reconstruction_cache:
             return self.reconstruction_cache[cache_key]
         
-        su = StationaryUnit(x=[1.0, 1.0, 1.0])
-        
-        for morph in breakdown.morphemes:
-            reg = self.morpheme_registry.get(morph, self.morpheme_registry["<id>"])
-            su.x = self._apply_linear(reg.M, reg.b, su.x)
-            su.level += 1
-            su.kappa *= 0.95
-            su.morpheme_trace.append(morph)
+        if len(self._morpheme_index) != len(self.morpheme_registry):
+            self._stack_morphemes()
         
+        if _reconstruct_kernel is not None:
+            identity = self._morpheme_index["<id>"]
+            indices = np.array([self._morpheme_index.get(m, identity) for m in breakdown.morphemes],
+                               dtype=np.int64)
+            x, kappa = _reconstruct_kernel(indices, self._Ms, self._bs)
+            su = StationaryUnit(x=x, level=len(indices), kappa=kappa,
+                                morpheme_trace=list(breakdown.morphemes))
+        else:
+            su = StationaryUnit(x=np.ones(3))
+            rows = self._linear_rows
+            identity = rows["<id>"]
+            x = [1.0, 1.0, 1.0]
+            
+            for morph in breakdown.morphemes:
+                M, b = rows.get(morph, identity)
+                x = self._apply_linear_3d(M, b, x)
+                su.level += 1
+                su.kappa *= 0.95
+                su.morpheme_trace.append(morph)
+            su.x = np.array(x)
+        
+        if len(self.reconstruction_cache) >= self.cache_limit:
+            del self.reconstruction_cache[next(iter(self.reconstruction_cache))]
         self.reconstruction_cache[cache_key] = su
         return su
     
     @staticmethod
-    def _apply_linear(M: list[list[float]], b: list[float], x: list[float]) -> list[float]:
+    def _apply_linear(M: np.ndarray, b: np.ndarray, x: np.ndarray) -> np.ndarray:
         """Apply linear transformation Mx + b"""
-        y = [0.0] * len(M)
-        for i, row in enumerate(M):
-            for j, val in enumerate(row):
-                y[i] += val * (x[j] if j < len(x) else 0)
-            y[i] += b[i] if i < len(b) else 0
-        return y
+        return M.dot(x) + b
+    
+    @staticmethod
+    def _apply_linear_3d(M: list[list[float]], b: list[float], x: list[float]) -> list[float]:
+        """Apply Mx + b for the fixed 3-D morpheme case, unrolled over plain floats"""
+        x0, x1, x2 = x
+        r0, r1, r2 = M
+        return [
+            r0[0] * x0 + r0[1] * x1 + r0[2] * x2 + b[0],
+            r1[0] * x0 + r1[1] * x1 + r1[2] * x2 + b[1],
+            r2[0] * x0 + r2[1] * x1 + r2[2] * x2 + b[2],
+        ]
 
 # ============================================================================
 # LEXICAL LOGIC ENGINE (WORD BUTTONS & SEMANTIC REASONING)
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class WordButton:
     """Semantic unit with activation state and transformation"""
     name: str
@@ -177,21 +246,42 @@ class WordButton:
     transform_scale: float = 1.0
     metadata: dict[str, Any] = field(default_factory=dict)
 
-@dataclass
+@dataclass(slots=True)
 class SemanticState:
     """Current state of lexical logic engine"""
     active_buttons: list[str]
     reasoning_chain: list[str]
-    semantic_vector: list[float]
+    semantic_vector: np.ndarray
     timestamp: float = field(default_factory=time.time)
 
 class LexicalLogicEngine:
     """Semantic reasoning via word button system"""
     
-    def __init__(self):
-        self.buttons: dict[str, WordButton] = self._init_buttons()
-        self.state = SemanticState(active_buttons=[], reasoning_chain=[], semantic_vector=[])
-        self.reasoning_history: list[SemanticState] = []
+    def __init__(self, max_history: int = 1024):
+        self.buttons: dict[str, WordButton] = {sys.intern(k): b for k, b in self._init_buttons().items()}
+        self._index_buttons()
+        self.state = SemanticState(active_buttons=[], reasoning_chain=[], semantic_vector=self._activations)
+        # (button_name, timestamp) per activation; the full state is always self.state
+        self.reasoning_history: deque[tuple[str, float]] = deque(maxlen=max_history)
+    
+    def _index_buttons(self) -> None:
+        """Lay activations out as one array indexed by sorted button name"""
+        self._names = tuple(sorted(self.buttons))
+        self._idx = {name: i for i, name in enumerate(self._names)}
+        self._conn_idx = {
+            name: tuple(self._idx[c] for c in btn.connections if c in self._idx)
+            for name, btn in self.buttons.items()
+        }
+        # Registration order, used to list active buttons as the dict would
+        self._order = tuple(self._idx[name] for name in self.buttons)
+        self._activations = np.array([self.buttons[n].activation for n in self._names], dtype=np.float64)
+        if hasattr(self, "state"):
+            self.state.semantic_vector = self._activations
+    
+    def add_button(self, button: WordButton) -> None:
+        """Register (or replace) a word button and rebuild the activation index"""
+        self.buttons[sys.intern(button.name)] = button
+        self._index_buttons()
     
     def _init_buttons(self) -> dict[str, WordButton]:
         """Initialize word buttons with semantic connections"""
@@ -222,33 +312,42 @@ class LexicalLogicEngine:
         """Activate a word button and propagate semantics"""
         if button_name not in self.buttons:
             raise ValueError(f"Unknown button: {button_name}")
-        
-        button = self.buttons[button_name]
-        button.activation = min(1.0, button.activation + 0.3)
-        
-        for conn in button.connections:
-            if conn in self.buttons:
-                self.buttons[conn].activation = min(1.0, self.buttons[conn].activation + 0.1)
-        
-        self.state.active_buttons = [b for b, btn in self.buttons.items() if btn.activation > 0.5]
-        self.state.reasoning_chain.append(button_name)
-        self.state.semantic_vector = [self.buttons[b].activation for b in sorted(self.buttons.keys())]
+        # Buttons added straight to self.buttons are picked up here
+        if button_name not in self._idx or len(self.buttons) != len(self._names):
+            self._index_buttons()
+        
+        # Only a handful of entries change per call, so update them as scalars
+        act = self._activations
+        names = self._names
+        buttons = self.buttons
+        i = self._idx[button_name]
+        v = act.item(i) + 0.3
+        act[i] = buttons[button_name].activation = v if v < 1.0 else 1.0
+        for j in self._conn_idx[button_name]:
+            v = act.item(j) + 0.1
+            act[j] = buttons[names[j]].activation = v if v < 1.0 else 1.0
+        
+        values = act.tolist()
+        self.state.active_buttons = [names[j] for j in self._order if values[j] > 0.5]
+        self.state.reasoning_chain.append(sys.intern(button_name))
+        self.state.semantic_vector = act
         self.state.timestamp = time.time()
         
-        self.reasoning_history.append(self.state)
+        self.reasoning_history.append((button_name, self.state.timestamp))
         return self.state
     
     def reset(self):
         """Reset all buttons and state"""
         for btn in self.buttons.values():
             btn.activation = 0.0
-        self.state = SemanticState(active_buttons=[], reasoning_chain=[], semantic_vector=[])
+        self._activations[:] = 0.0
+        self.state = SemanticState(active_buttons=[], reasoning_chain=[], semantic_vector=self._activations)
 
 # ============================================================================
 # PIPELINE CANVAS (ZONE ORCHESTRATION)
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class PipelineRecord:
     """Record of pipeline execution"""
     zone: PipelineZone
@@ -260,10 +359,13 @@ class PipelineRecord:
 class PipelineCanvas:
     """Orchestrate 8-stage pipeline with zone transitions"""
     
-    def __init__(self):
+    def __init__(self, history_limit: int = 256, debug: bool = False):
         self.current_zone = PipelineZone.HEAD
         self.cycle_count = 0
-        self.history: list[PipelineRecord] = []
+        self.history_limit = history_limit
+        self.debug = debug
+        self.history: deque[PipelineRecord] = deque(maxlen=history_limit)
+        self._prev_keys: frozenset[str] = frozenset()
         self.zone_handlers: dict[PipelineZone, Callable] = self._init_zone_handlers()
     
     def _init_zone_handlers(self) -> dict[PipelineZone, Callable]:
@@ -282,11 +384,18 @@ class PipelineCanvas:
     def transition(self, next_zone: PipelineZone, state: dict[str, Any]) -> PipelineRecord:
         """Move to next zone and execute handler"""
         self.cycle_count += 1
+        # Full copies only in debug mode; otherwise record the keys added since the last transition
+        if self.debug:
+            snapshot = state.copy()
+        else:
+            keys = frozenset(state)
+            snapshot = {k: state[k] for k in keys - self._prev_keys}
+            self._prev_keys = keys
         record = PipelineRecord(
             zone=next_zone,
             cycle=self.cycle_count,
             timestamp=time.time(),
-            state_snapshot=state.copy()
+            state_snapshot=snapshot
         )
         self.history.append(record)
         
@@ -305,12 +414,19 @@ class PipelineCanvas:
     def _zone_pattern(self, state): return ["recognize_patterns"]
     def _zone_rebuild(self, state): return ["reconstruct"]
     def _zone_output(self, state): return ["generate_output"]
+    
+    def reset(self):
+        """Return to HEAD and drop transition history"""
+        self.current_zone = PipelineZone.HEAD
+        self.cycle_count = 0
+        self.history.clear()
+        self._prev_keys = frozenset()
 
 # ============================================================================
 # KNOWLEDGE VAULT (CENTRAL DATA HUB)
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class SystemStatus:
     """Status of a single system"""
     name: str
@@ -319,14 +435,23 @@ class SystemStatus:
     compliance: ComplianceLevel
     cycle_count: int = 0
     details: dict[str, Any] = field(default_factory=dict)
+    # compliance.value, kept in step by KnowledgeVault so manifests skip the enum lookup
+    compliance_value: str = field(init=False, repr=False, default="")
+    
+    def __post_init__(self):
+        self.compliance_value = self.compliance.value
 
 class KnowledgeVault:
     """Central data hub for all systems"""
     
-    def __init__(self):
+    def __init__(self, log_capacity: int = 10_000,
+                 persist_to: Callable[[dict[str, Any]], None] | None = None):
         self.systems: dict[str, SystemStatus] = {}
         self.data_storage: dict[str, Any] = {}
-        self.execution_history: list[dict[str, Any]] = []
+        # Most recent records only; persist_to receives each record as it is evicted
+        self.execution_history: deque[dict[str, Any]] = deque(maxlen=log_capacity)
+        self.execution_count = 0
+        self.persist_to = persist_to
         self.metrics: dict[str, int] = {
             "tokens_processed": 0,
             "morphemes_decomposed": 0,
@@ -334,23 +459,26 @@ class KnowledgeVault:
             "zone_transitions": 0,
             "automations_triggered": 0
         }
+        self._iso_ms = -1  # wall-clock millisecond _iso was formatted for
+        self._iso = ""
     
-    def register_system(self, name: str, role: SystemRole) -> None:
+    def register_system(self, name: str, role: SystemRole, ts: float | None = None) -> None:
         """Register a system in the vault"""
         self.systems[name] = SystemStatus(
             name=name,
             status="operational",
-            timestamp=time.time(),
+            timestamp=time.time() if ts is None else ts,
             compliance=ComplianceLevel.OK
         )
     
     def update_system(self, name: str, status: str, compliance: ComplianceLevel, 
-                     details: dict[str, Any] = None) -> None:
+                     details: dict[str, Any] = None, ts: float | None = None) -> None:
         """Update system status"""
         if name in self.systems:
             self.systems[name].status = status
             self.systems[name].compliance = compliance
-            self.systems[name].timestamp = time.time()
+            self.systems[name].compliance_value = compliance.value
+            self.systems[name].timestamp = time.time() if ts is None else ts
             if details:
                 self.systems[name].details.update(details)
     
@@ -362,33 +490,62 @@ class KnowledgeVault:
         """Retrieve data from vault"""
         return self.data_storage.get(key)
     
-    def log_execution(self, execution_record: dict[str, Any]) -> None:
+    def log_execution(self, execution_record: dict[str, Any], ts: float | None = None) -> None:
         """Log an execution cycle"""
-        self.execution_history.append({
+        history = self.execution_history
+        if self.persist_to is not None and len(history) == history.maxlen:
+            self.persist_to(history[0])
+        self.execution_count += 1
+        history.append({
             **execution_record,
-            "timestamp": time.time()
+            "timestamp": time.time() if ts is None else ts
         })
     
+    def reset(self) -> None:
+        """Clear stored data, history and counters; registered systems return to operational"""
+        self.data_storage.clear()
+        self.execution_history.clear()
+        self.execution_count = 0
+        for metric in self.metrics:
+            self.metrics[metric] = 0
+        for s in self.systems.values():
+            s.status = "operational"
+            s.compliance = ComplianceLevel.OK
+            s.compliance_value = ComplianceLevel.OK.value
+            s.cycle_count = 0
+            s.details = {}
+    
     def increment_metric(self, metric: str, value: int = 1) -> None:
         """Increment a metric"""
-        if metric in self.metrics:
+        try:
             self.metrics[metric] += value
+        except KeyError:
+            pass
+    
+    def _iso_now(self) -> str:
+        """ISO timestamp, reformatted whenever the wall-clock millisecond changes"""
+        now = time.time()
+        ms = int(now * 1000)
+        if ms != self._iso_ms:
+            self._iso_ms = ms
+            self._iso = datetime.fromtimestamp(now).isoformat()
+        return self._iso
     
     def create_manifest(self) -> dict[str, Any]:
         """Create unified manifest of all system states"""
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._iso_now(),
             "systems": {
                 name: {
                     "status": s.status,
-                    "compliance": s.compliance.value,
+                    "compliance": s.compliance_value,
                     "cycle_count": s.cycle_count,
                     "details": s.details
                 }
                 for name, s in self.systems.items()
             },
             "metrics": self.metrics,
-            "execution_count": len(self.execution_history),
+            "execution_count": self.execution_count,
             "data_keys": list(self.data_storage.keys())
         }
 
@@ -396,7 +553,7 @@ class KnowledgeVault:
 # UPFLOW AUTOMATION (DECISION AND ACTION ROUTING)
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class AutomationRule:
     """Rule for automating system actions"""
     trigger: str
@@ -407,9 +564,14 @@ class AutomationRule:
 class UpflowAutomation:
     """Route decisions through physics/rendering/procedural systems"""
     
-    def __init__(self):
-        self.rules: list[AutomationRule] = self._init_rules()
-        self.action_log: list[dict[str, Any]] = []
+    def __init__(self, log_capacity: int = 10_000):
+        # Kept in descending priority order so apply_rules needs no per-call sort
+        self.rules: list[AutomationRule] = sorted(self._init_rules(), key=lambda r: r.priority, reverse=True)
+        self.action_log: deque[dict[str, Any]] = deque(maxlen=log_capacity)
+    
+    def add_rule(self, rule: AutomationRule) -> None:
+        """Insert a rule after existing rules of equal or higher priority"""
+        bisect.insort(self.rules, rule, key=lambda r: -r.priority)
     
     def _init_rules(self) -> list[AutomationRule]:
         """Initialize automation rules"""
@@ -469,39 +631,64 @@ class UpflowAutomation:
             }
         }
     
+    # Palette for an empty embedding list (hue 0, saturation/lightness 50)
+    _EMPTY_PALETTE = MappingProxyType({
+        "primary": "hsl(0, 50%, 50%)",
+        "secondary": "hsl(120, 50%, 50%)"
+    })
+    
     @staticmethod
     def _embedding_to_color(state: dict[str, Any]) -> dict[str, Any]:
         """Map embeddings to color palette"""
         embeddings = state.get("embeddings", [0.5, 0.5, 0.5])
+        n = len(embeddings)
+        if n == 0:
+            return {"colors": dict(UpflowAutomation._EMPTY_PALETTE)}
         
-        hue = (embeddings[0] * 360) if len(embeddings) > 0 else 0
-        saturation = (embeddings[1] * 100) if len(embeddings) > 1 else 50
-        lightness = (embeddings[2] * 100) if len(embeddings) > 2 else 50
+        hue = embeddings[0] * 360
+        saturation = (embeddings[1] * 100) if n > 1 else 50
+        lightness = (embeddings[2] * 100) if n > 2 else 50
+        tail = f", {saturation}%, {lightness}%)"
         
         return {
             "colors": {
-                "primary": f"hsl({hue}, {saturation}%, {lightness}%)",
-                "secondary": f"hsl({(hue + 120) % 360}, {saturation}%, {lightness}%)"
+                "primary": f"hsl({hue}{tail}",
+                "secondary": f"hsl({(hue + 120) % 360}{tail}"
             }
         }
     
-    def apply_rules(self, state: dict[str, Any]) -> dict[str, Any]:
-        """Apply all triggered rules"""
-        result = state.copy()
-        
-        for rule in sorted(self.rules, key=lambda r: -r.priority):
-            if rule.condition(state):
-                try:
-                    action_result = rule.action(state)
-                    result.update(action_result)
-                    self.action_log.append({
-                        "rule": rule.trigger,
-                        "timestamp": time.time(),
-                        "result": action_result
-                    })
-                except Exception:
-                    pass
-        
+    def apply_rules(self, state: dict[str, Any], ts: float | None = None,
+                    inplace: bool = True) -> dict[str, Any]:
+        """Apply all triggered rules; ts stamps the action log (defaults to now).
+        
+        Results are merged into state itself unless inplace is False. Every rule
+        still sees the state as it was on entry: results are merged afterwards.
+        """
+        if ts is None:
+            ts = time.time()
+        
+        results = []
+        for rule in self.rules:
+            if not rule.condition(state):
+                continue
+            # A failing rule is logged and skipped; it must not abort orchestration
+            try:
+                action_result = rule.action(state)
+            except Exception:
+                logger.debug("Automation rule %s failed", rule.trigger, exc_info=True)
+                continue
+            if action_result is None:
+                continue
+            results.append(action_result)
+            self.action_log.append({
+                "rule": rule.trigger,
+                "timestamp": ts,
+                "result": action_result
+            })
+        
+        result = state if inplace else state.copy()
+        for action_result in results:
+            result.update(action_result)
         return result
 
 # ============================================================================
@@ -518,48 +705,60 @@ class MetaOrchestrator:
         self.vault = KnowledgeVault()
         self.upflow = UpflowAutomation()
         
-        for role in SystemRole:
-            self.vault.register_system(role.value, role)
+        for value, role in _SYSTEM_ROLES:
+            self.vault.register_system(value, role)
     
     def orchestrate(self, input_text: str) -> dict[str, Any]:
         """Execute full orchestration cycle"""
+        # One clock read stamps the state, rule log and execution record
+        now = time.time()
         execution_state = {
             "input": input_text,
-            "timestamp": time.time()
+            "timestamp": now
         }
         
+        # Fixed metric names always exist, so bump the vault counters directly
+        metrics = self.vault.metrics
+        
         tokens = input_text.lower().split()
         execution_state["tokens"] = tokens
-        self.vault.increment_metric("tokens_processed", len(tokens))
+        metrics["tokens_processed"] += len(tokens)
         
         breakdowns = [self.token_lab.breakdown(t) for t in tokens]
         execution_state["breakdowns"] = [bd.morphemes for bd in breakdowns]
-        self.vault.increment_metric("morphemes_decomposed", 
-                                   sum(len(bd.morphemes) for bd in breakdowns))
+        metrics["morphemes_decomposed"] += sum(len(bd.morphemes) for bd in breakdowns)
         
         reconstructions = [self.token_lab.reconstruct(bd) for bd in breakdowns]
-        execution_state["reconstructions"] = [r.x for r in reconstructions]
-        
-        embeddings = [sum(r.x) / len(r.x) for r in reconstructions]
+        if reconstructions:
+            X = np.array([r.x for r in reconstructions])
+            execution_state["reconstructions"] = X.tolist()
+            embeddings = X.mean(axis=1).tolist()
+        else:
+            execution_state["reconstructions"] = []
+            embeddings = []
         execution_state["embeddings"] = embeddings
         
         avg_embedding = sum(embeddings) / len(embeddings) if embeddings else 0.5
-        if avg_embedding > 0.6:
-            decision = "aggressive"
-        elif avg_embedding > 0.3:
-            decision = "balanced"
-        else:
-            decision = "gentle"
+        # > 0.6 aggressive, > 0.3 balanced, otherwise (including NaN) gentle
+        decision = _DECISIONS[(not avg_embedding > 0.6) + (not avg_embedding > 0.3)]
         execution_state["decision"] = decision
-        self.vault.increment_metric("logic_decisions", 1)
+        metrics["logic_decisions"] += 1
         
-        execution_state = self.upflow.apply_rules(execution_state)
+        execution_state = self.upflow.apply_rules(execution_state, ts=now)
         
-        self.vault.increment_metric("zone_transitions", 5)
-        self.vault.log_execution(execution_state)
+        metrics["zone_transitions"] += 5
+        self.vault.log_execution(execution_state, ts=now)
         
         return execution_state
     
+    def reset_state(self) -> None:
+        """Clear per-run state; morpheme registry and caches are kept"""
+        self.lexical_engine.reset()
+        self.lexical_engine.reasoning_history.clear()
+        self.pipeline.reset()
+        self.vault.reset()
+        self.upflow.action_log.clear()
+    
     def get_status(self) -> dict[str, Any]:
         """Get current orchestrator status"""
         return self.vault.create_manifest()
@@ -10,13 +10,47 @@ Converts orchestrator semantic outputs to physics parameters:
 from __future__ import annotations
 import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; step_simulation falls back to NumPy
+    njit = None
 
 # Note: physics.body module may provide RigidBody and Vector3 in the future
 # for integration with a more advanced physics engine
 
 
-@dataclass
+if njit is not None:
+    @njit('void(float64[:, :], float64[:, :], float64[:, :], float64[:, :], float64[:], float64[:], '
+          'float64[:], boolean[:], float64[:], float64)', parallel=True, cache=True)
+    def _verlet_kernel(pos, old, vel, acc, mass, rest, grav, static, ke, dt):
+        """Native Verlet step with ground bounce, in place (see step_simulation)."""
+        for i in prange(pos.shape[0]):
+            if static[i]:
+                continue
+            acc[i, 0] = 0.0
+            acc[i, 1] = -grav[i]
+            acc[i, 2] = 0.0
+            speed_sq = 0.0
+            for k in range(3):
+                v = pos[i, k] - old[i, k]
+                old[i, k] = pos[i, k]
+                pos[i, k] = pos[i, k] + v + acc[i, k] * dt * dt
+                vel[i, k] = v / dt
+                speed_sq += vel[i, k] * vel[i, k]
+            ke[i] = 0.5 * mass[i] * speed_sq
+            if pos[i, 1] < 0:
+                pos[i, 1] = 0.0
+                old[i, 1] = pos[i, 1] - (-vel[i, 1] * rest[i]) * dt
+else:
+    _verlet_kernel = None
+
+
+@dataclass(slots=True)
 class Vector3:
     """Simple 3D vector for physics calculations."""
     x: float = 0.0
@@ -29,11 +63,25 @@ class Vector3:
     def __mul__(self, scalar: float):
         return Vector3(self.x * scalar, self.y * scalar, self.z * scalar)
     
+    def set(self, x: float, y: float, z: float) -> Vector3:
+        """Overwrite components in place."""
+        self.x = x
+        self.y = y
+        self.z = z
+        return self
+    
+    def iadd(self, other: Vector3) -> Vector3:
+        """Add another vector in place."""
+        self.x += other.x
+        self.y += other.y
+        self.z += other.z
+        return self
+    
     def to_tuple(self) -> Tuple[float, float, float]:
         return (self.x, self.y, self.z)
 
 
-@dataclass
+@dataclass(slots=True)
 class PhysicsBody:
     """A physics body created from orchestrator state."""
     body_id: str
@@ -50,13 +98,164 @@ class PhysicsBody:
     kinetic_energy: float = 0.0
 
 
+_VECTOR_FIELDS = ('position', 'old_position', 'velocity', 'acceleration')
+
+
 class PhysicsOrchestratorBridge:
-    """Bridge between MetaOrchestrator and physics simulation."""
+    """Bridge between MetaOrchestrator and physics simulation.
+    
+    Integration runs on structure-of-arrays columns, one row per body (see
+    _rows). PhysicsBody objects stay the public view: they are written back
+    from the columns only when handed out through `bodies`, and the next step
+    reloads the columns from them, so edits made through `bodies` take effect.
+    The orchestrator paths write just the affected body's row, so they never
+    pay for a reload. Add and remove bodies through the bridge; after editing
+    a PhysicsBody held from elsewhere, call sync_body().
+    """
     
     def __init__(self):
-        self.bodies: Dict[str, PhysicsBody] = {}
+        self._bodies: Dict[str, PhysicsBody] = {}
         self.integration_steps = 0
         self.time_step = 1.0 / 60.0
+        
+        self._rows: Dict[str, int] = {}          # body id -> column row
+        self._pending: List[PhysicsBody] = []    # created bodies not yet in the columns
+        self._objects_stale = False  # columns have advanced past the bodies
+        self._handed_out = False     # bodies were exposed and may have been edited
+        self._pos = self._old = self._vel = self._acc = np.zeros((0, 3))
+        self._mass = self._rest = self._grav = self._ke = np.zeros(0)
+        self._static = np.zeros(0, dtype=bool)
+    
+    @property
+    def bodies(self) -> Mapping[str, PhysicsBody]:
+        """Read-only view of bodies by id, brought up to date with the simulation.
+        
+        Edits to the bodies are picked up by the next step; use
+        create_body_from_orchestrator and remove_body to change the set.
+        """
+        self._sync_objects()
+        self._handed_out = True
+        return MappingProxyType(self._bodies)
+    
+    def remove_body(self, body_id: str) -> PhysicsBody:
+        """Remove a body and compact the rows after it.
+        
+        Raises:
+            KeyError: If no body has that id
+        """
+        self._sync_objects()
+        row = self._rows.pop(body_id)
+        body = self._bodies.pop(body_id)
+        n = len(self._mass)
+        if row < n:
+            for name in ('_pos', '_old', '_vel', '_acc', '_mass', '_rest', '_grav', '_ke', '_static'):
+                setattr(self, name, np.delete(getattr(self, name), row, axis=0))
+        else:
+            del self._pending[row - n]
+        for bid, r in self._rows.items():
+            if r > row:
+                self._rows[bid] = r - 1
+        return body
+    
+    def sync_body(self, body_id: str) -> None:
+        """Copy a directly edited PhysicsBody back into its column row.
+        
+        Vector fields must not be shared with other bodies.
+        """
+        body = self._bodies[body_id]
+        row = self._rows[body_id]
+        if row < len(self._mass):
+            self._own_vectors([body])
+            self._store_row(row, body)
+    
+    def _sync_arrays(self) -> None:
+        """Reload the columns if bodies were handed out, else append new bodies."""
+        if self._handed_out:
+            self._reload_arrays()
+            return
+        if not self._pending:
+            return
+        bodies = self._pending
+        self._pos = np.concatenate([self._pos, [b.position.to_tuple() for b in bodies]])
+        self._old = np.concatenate([self._old, [b.old_position.to_tuple() for b in bodies]])
+        self._vel = np.concatenate([self._vel, [b.velocity.to_tuple() for b in bodies]])
+        self._acc = np.concatenate([self._acc, [b.acceleration.to_tuple() for b in bodies]])
+        self._mass = np.concatenate([self._mass, [b.mass for b in bodies]])
+        self._rest = np.concatenate([self._rest, [b.restitution for b in bodies]])
+        self._grav = np.concatenate([self._grav, [b.gravity for b in bodies]])
+        self._ke = np.concatenate([self._ke, [b.kinetic_energy for b in bodies]])
+        self._static = np.concatenate([self._static, [b.is_static for b in bodies]])
+        self._pending = []
+    
+    def _reload_arrays(self) -> None:
+        """Rebuild every column from the PhysicsBody objects, in row order."""
+        bodies: List[PhysicsBody] = [None] * len(self._rows)
+        for bid, row in self._rows.items():
+            bodies[row] = self._bodies[bid]
+        self._own_vectors(bodies)
+        self._pos = np.array([b.position.to_tuple() for b in bodies], dtype=np.float64).reshape(-1, 3)
+        self._old = np.array([b.old_position.to_tuple() for b in bodies], dtype=np.float64).reshape(-1, 3)
+        self._vel = np.array([b.velocity.to_tuple() for b in bodies], dtype=np.float64).reshape(-1, 3)
+        self._acc = np.array([b.acceleration.to_tuple() for b in bodies], dtype=np.float64).reshape(-1, 3)
+        self._mass = np.array([b.mass for b in bodies], dtype=np.float64)
+        self._rest = np.array([b.restitution for b in bodies], dtype=np.float64)
+        self._grav = np.array([b.gravity for b in bodies], dtype=np.float64)
+        self._ke = np.array([b.kinetic_energy for b in bodies], dtype=np.float64)
+        self._static = np.array([b.is_static for b in bodies], dtype=bool)
+        self._pending = []
+        self._handed_out = False
+    
+    def _store_row(self, row: int, body: PhysicsBody) -> None:
+        """Write one body's fields into its column row."""
+        self._pos[row] = body.position.to_tuple()
+        self._old[row] = body.old_position.to_tuple()
+        self._vel[row] = body.velocity.to_tuple()
+        self._acc[row] = body.acceleration.to_tuple()
+        self._mass[row] = body.mass
+        self._rest[row] = body.restitution
+        self._grav[row] = body.gravity
+        self._ke[row] = body.kinetic_energy
+        self._static[row] = body.is_static
+    
+    def _load_row(self, row: int, body: PhysicsBody) -> None:
+        """Write one column row back into its body (dynamic bodies only)."""
+        if body.is_static:
+            return
+        body.position.set(*self._pos[row].tolist())
+        body.old_position.set(*self._old[row].tolist())
+        body.velocity.set(*self._vel[row].tolist())
+        body.acceleration.set(*self._acc[row].tolist())
+        body.kinetic_energy = self._ke.item(row)
+    
+    @staticmethod
+    def _own_vectors(bodies: List[PhysicsBody]) -> None:
+        """Give every vector field its own Vector3 so write-back can update in place."""
+        seen = set()
+        for body in bodies:
+            for name in _VECTOR_FIELDS:
+                v = getattr(body, name)
+                if id(v) in seen:
+                    v = Vector3(v.x, v.y, v.z)
+                    setattr(body, name, v)
+                seen.add(id(v))
+    
+    def _sync_objects(self) -> None:
+        """Write integrated columns back into the PhysicsBody objects in place."""
+        if not self._objects_stale:
+            return
+        n = len(self._mass)
+        pos, old, vel = self._pos.tolist(), self._old.tolist(), self._vel.tolist()
+        acc, ke = self._acc.tolist(), self._ke.tolist()
+        for bid, row in self._rows.items():
+            body = self._bodies[bid]
+            if row >= n or body.is_static:
+                continue
+            body.position.set(*pos[row])
+            body.old_position.set(*old[row])
+            body.velocity.set(*vel[row])
+            body.acceleration.set(*acc[row])
+            body.kinetic_energy = ke[row]
+        self._objects_stale = False
     
     def create_body_from_orchestrator(
         self, 
@@ -101,7 +300,15 @@ class PhysicsOrchestratorBridge:
             old_position=Vector3(position.x, position.y, position.z)
         )
         
-        self.bodies[body_id] = body
+        self._bodies[body_id] = body
+        row = self._rows.get(body_id)
+        if row is None:
+            self._rows[body_id] = len(self._rows)
+            self._pending.append(body)
+        elif row < len(self._mass):
+            self._store_row(row, body)
+        else:
+            self._pending[row - len(self._mass)] = body
         return body
     
     def apply_orchestrator_to_body(
@@ -110,9 +317,13 @@ class PhysicsOrchestratorBridge:
         orchestrator_state: Dict[str, Any]
     ) -> Optional[PhysicsBody]:
         """Apply new orchestrator state to existing body."""
-        body = self.bodies.get(body_id)
-        if not body:
+        row = self._rows.get(body_id)
+        if row is None:
             return self.create_body_from_orchestrator(body_id, orchestrator_state)
+        body = self._bodies[body_id]
+        in_columns = row < len(self._mass)
+        if in_columns and self._objects_stale:
+            self._load_row(row, body)
         
         physics_params = orchestrator_state.get('physics_params', {})
         
@@ -125,6 +336,8 @@ class PhysicsOrchestratorBridge:
         if 'mass' in physics_params:
             body.mass = physics_params['mass']
         
+        if in_columns:
+            self._store_row(row, body)
         return body
     
     def step_simulation(self, dt: Optional[float] = None) -> Dict[str, Any]:
@@ -139,80 +352,80 @@ class PhysicsOrchestratorBridge:
         """
         dt = dt or self.time_step
         self.integration_steps += 1
+        self._sync_arrays()
         
-        # Verlet integration for all bodies
-        for body in self.bodies.values():
-            if body.is_static:
-                continue
-            
-            # Apply gravity
-            body.acceleration = Vector3(0, -body.gravity, 0)
-            
-            # Verlet integration: x(t+dt) = 2*x(t) - x(t-dt) + a*dt^2
-            vel = Vector3(
-                body.position.x - body.old_position.x,
-                body.position.y - body.old_position.y,
-                body.position.z - body.old_position.z
-            )
-            
-            new_pos = Vector3(
-                body.position.x + vel.x + body.acceleration.x * dt * dt,
-                body.position.y + vel.y + body.acceleration.y * dt * dt,
-                body.position.z + vel.z + body.acceleration.z * dt * dt
-            )
-            
-            body.old_position = body.position
-            body.position = new_pos
-            
-            # Update velocity
-            body.velocity = Vector3(vel.x / dt, vel.y / dt, vel.z / dt)
-            
-            # Calculate kinetic energy
-            speed_sq = body.velocity.x**2 + body.velocity.y**2 + body.velocity.z**2
-            body.kinetic_energy = 0.5 * body.mass * speed_sq
-            
-            # Ground collision (simple plane at y=0)
-            if body.position.y < 0:
-                body.position = Vector3(body.position.x, 0, body.position.z)
-                # Bounce: reflect velocity and apply restitution
-                # In Verlet, velocity is implicit from position difference
-                # To bounce, we set old_position such that the next position difference
-                # gives upward velocity
-                current_vel_y = body.velocity.y
-                bounced_vel_y = -current_vel_y * body.restitution
-                # old_position.y should be: position.y - bounced_vel_y * dt
-                body.old_position = Vector3(
-                    body.old_position.x,
-                    body.position.y - bounced_vel_y * dt,
-                    body.old_position.z
-                )
+        if _verlet_kernel is not None:
+            _verlet_kernel(self._pos, self._old, self._vel, self._acc, self._mass,
+                           self._rest, self._grav, self._static, self._ke, dt)
+            self._objects_stale = True
+            return self._gather_state()
+        
+        # Verlet integration for all dynamic bodies at once
+        live = ~self._static
+        pos, old, acc = self._pos[live], self._old[live], self._acc[live]
+        
+        # Apply gravity
+        acc[:] = 0.0
+        acc[:, 1] = -self._grav[live]
+        
+        # Verlet integration: x(t+dt) = 2*x(t) - x(t-dt) + a*dt^2
+        vel = pos - old
+        new_pos = pos + vel + acc * dt * dt
+        old = pos
+        pos = new_pos
+        
+        # Update velocity
+        vel = vel / dt
+        
+        # Calculate kinetic energy
+        speed_sq = vel[:, 0]**2 + vel[:, 1]**2 + vel[:, 2]**2
+        ke = 0.5 * self._mass[live] * speed_sq
+        
+        # Ground collision (simple plane at y=0)
+        # Bounce by placing old_position so the next position difference
+        # gives the reflected, restitution-scaled upward velocity
+        ground = pos[:, 1] < 0
+        if ground.any():
+            pos[ground, 1] = 0.0
+            bounced_vel_y = -vel[ground, 1] * self._rest[live][ground]
+            old[ground, 1] = pos[ground, 1] - bounced_vel_y * dt
+        
+        self._pos[live] = pos
+        self._old[live] = old
+        self._vel[live] = vel
+        self._acc[live] = acc
+        self._ke[live] = ke
+        self._objects_stale = True
         
         return self._gather_state()
     
     def _gather_state(self) -> Dict[str, Any]:
         """Gather current simulation state."""
-        total_ke = sum(b.kinetic_energy for b in self.bodies.values())
+        self._sync_arrays()
+        kinetic = self._ke.tolist()
+        total_ke = sum(kinetic)
+        pos, vel = self._pos.tolist(), self._vel.tolist()
         
         return {
             'step': self.integration_steps,
             'total_kinetic_energy': total_ke,
-            'body_count': len(self.bodies),
+            'body_count': len(self._bodies),
             'bodies': {
                 bid: {
-                    'position': b.position.to_tuple(),
-                    'velocity': b.velocity.to_tuple(),
-                    'kinetic_energy': b.kinetic_energy
+                    'position': tuple(pos[row]),
+                    'velocity': tuple(vel[row]),
+                    'kinetic_energy': kinetic[row]
                 }
-                for bid, b in self.bodies.items()
+                for bid, row in self._rows.items()
             }
         }
     
     def get_system_status(self) -> Dict[str, Any]:
         """Get physics system status."""
         return {
-            'active_bodies': len(self.bodies),
+            'active_bodies': len(self._bodies),
             'total_integration_steps': self.integration_steps,
-            'body_ids': list(self.bodies.keys())
+            'body_ids': list(self._bodies.keys())
         }
 
 
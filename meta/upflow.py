@@ -1,6 +1,22 @@
 from __future__ import annotations
 import hashlib
 import math
+from functools import lru_cache
+
+try:
+    from physics.body import Vec3
+except ImportError:  # physics.body is optional; apply_to_physics_body leaves vector fields untouched
+    Vec3 = None
+
+
+@lru_cache(maxsize=4096)
+def _token_seeds(joined: str) -> tuple:
+    """MD5-derived (mass_seed, vel_x, vel_y) for a joined token string."""
+    token_hash = hashlib.md5(joined.encode()).digest()
+    mass_seed = int.from_bytes(token_hash[:4], 'little') % 1000 / 1000.0
+    vel_x = (int.from_bytes(token_hash[4:8], 'little') % 200 - 100) / 100.0
+    vel_y = (int.from_bytes(token_hash[8:12], 'little') % 200 - 100) / 100.0
+    return mass_seed, vel_x, vel_y
 
 class UpflowAutomation:
     def __init__(self):
@@ -18,11 +34,8 @@ class UpflowAutomation:
             'restitution': 0.6
         }
         if tokens:
-            token_hash = hashlib.md5(''.join(tokens).encode()).digest()
-            mass_seed = int.from_bytes(token_hash[:4], 'little') % 1000 / 1000.0
+            mass_seed, vel_x, vel_y = _token_seeds(''.join(tokens))
             params['mass'] = 0.5 + mass_seed
-            vel_x = (int.from_bytes(token_hash[4:8], 'little') % 200 - 100) / 100.0
-            vel_y = (int.from_bytes(token_hash[8:12], 'little') % 200 - 100) / 100.0
             params['velocity'] = [vel_x, vel_y, 0.0]
         if embeddings:
             avg_emb = sum(embeddings) / len(embeddings) if embeddings else 0
@@ -65,13 +78,13 @@ class UpflowAutomation:
         return colors
 
     def build_flow_graph(self, tokens: list, embeddings: list, decision: str):
+        physics = self.token_to_physics_params(tokens, embeddings)
         self.flow_graph = {
             'stage_0_tokens': tokens,
             'stage_1_embeddings': embeddings[:10] if embeddings else [],
             'stage_2_decision': decision,
-            'stage_3_physics': self.token_to_physics_params(tokens, embeddings),
-            'stage_4_transform': self.decision_to_render_transform(decision, 
-                                   self.token_to_physics_params(tokens, embeddings)),
+            'stage_3_physics': physics,
+            'stage_4_transform': self.decision_to_render_transform(decision, physics),
             'stage_5_colors': self.embedding_to_color_palette(embeddings)
         }
         return self.flow_graph
@@ -81,14 +94,13 @@ class UpflowAutomation:
         if hasattr(body, 'mass'):
             body.mass = params.get('mass', 1.0)
             body.inv_mass = 1.0 / body.mass if body.mass > 0 else 0
-        if hasattr(body, 'velocity'):
-            vel = params.get('velocity', [0, 0, 0])
-            from physics.body import Vec3
-            body.velocity = Vec3(vel[0], vel[1], vel[2])
-        if hasattr(body, 'gravity'):
-            scale = params.get('gravity_scale', 1.0)
-            from physics.body import Vec3
-            body.gravity = Vec3(0, -9.81 * scale, 0)
+        if Vec3 is not None:
+            if hasattr(body, 'velocity'):
+                vel = params.get('velocity', [0, 0, 0])
+                body.velocity = Vec3(vel[0], vel[1], vel[2])
+            if hasattr(body, 'gravity'):
+                scale = params.get('gravity_scale', 1.0)
+                body.gravity = Vec3(0, -9.81 * scale, 0)
 
     def apply_to_renderer(self, renderer, transform_data: tuple) -> dict:
         position, rotation, scale = transform_data
@@ -42,17 +42,27 @@ class Vector3:
         )
 
     def magnitude(self) -> float:
-        return math.sqrt(self.x**2 + self.y**2 + self.z**2)
+        x, y, z = self.x, self.y, self.z
+        return math.sqrt(x * x + y * y + z * z)
 
     def normalize(self) -> 'Vector3':
         mag = self.magnitude()
         if mag < 1e-9:
             return Vector3(0, 0, 0)
-        return self.mult(1.0 / mag)
+        inv = 1.0 / mag
+        return Vector3(self.x * inv, self.y * inv, self.z * inv)
 
     def copy(self) -> 'Vector3':
         return Vector3(self.x, self.y, self.z)
 
+    def spatial_key(self, cell_size: float) -> Tuple[int, int, int]:
+        """Hash-grid cell containing this point (hashable, unlike Vector3)."""
+        return (
+            math.floor(self.x / cell_size),
+            math.floor(self.y / cell_size),
+            math.floor(self.z / cell_size)
+        )
+
 
 @dataclass
 class PhysicsBody:
@@ -359,17 +369,54 @@ class NexusCore:
 
         # STEP 3: Collision detection & resolution
         self.collisions.clear()
-        for i, b1 in enumerate(self.entities):
-            for j in range(i + 1, len(self.entities)):
-                b2 = self.entities[j]
-                collision = self.discern.detect_sphere_sphere(b1, b2)
-                if collision:
-                    self.collisions.append(collision)
-                    self.discern.resolve_collision(b1, b2, collision)
+        for i, j in self._broadphase_pairs():
+            b1 = self.entities[i]
+            b2 = self.entities[j]
+            collision = self.discern.detect_sphere_sphere(b1, b2)
+            if collision:
+                self.collisions.append(collision)
+                self.discern.resolve_collision(b1, b2, collision)
 
         # Return physics state for aesthetics feedback
         return self._gather_physics_state()
 
+    def _broadphase_pairs(self) -> list[Tuple[int, int]]:
+        """Candidate (i, j) pairs, i < j, from a uniform hash grid.
+
+        Cells are one max-diameter wide, so any overlapping pair shares a cell
+        or sits in adjacent cells. Pairs come back in the same order as the
+        exhaustive i < j scan. Bodies with a non-finite coordinate are left
+        out; the exhaustive distance test never matched them either.
+        """
+        if len(self.entities) < 2:
+            return []
+
+        cell_size = 2.0 * max(body.radius for body in self.entities)
+        if not cell_size > 0.0:
+            cell_size = 1.0
+
+        isfinite = math.isfinite
+        grid: dict[Tuple[int, int, int], list[int]] = {}
+        keys = []
+        for index, body in enumerate(self.entities):
+            p = body.position
+            if not (isfinite(p.x) and isfinite(p.y) and isfinite(p.z)):
+                continue
+            key = p.spatial_key(cell_size)
+            keys.append((index, key))
+            grid.setdefault(key, []).append(index)
+
+        pairs = []
+        for i, (cx, cy, cz) in keys:
+            for dx in (-1, 0, 1):
+                for dy in (-1, 0, 1):
+                    for dz in (-1, 0, 1):
+                        for j in grid.get((cx + dx, cy + dy, cz + dz), ()):
+                            if j > i:
+                                pairs.append((i, j))
+        pairs.sort()
+        return pairs
+
     def get_physics_state(self) -> dict:
         """Get current physics state metrics.
         
@@ -4,8 +4,10 @@ Starts Physics API server and serves the HTML dashboard
 """
 
 import os
+import socket
 import sys
 import threading
+import time
 import webbrowser
 from pathlib import Path
 from http.server import HTTPServer, SimpleHTTPRequestHandler
@@ -36,6 +38,21 @@ def start_physics_api():
         print(f"❌ Error starting Physics API: {e}")
         print("   Continuing with mock physics fallback...")
 
+def wait_for_port(port: int, timeout: float = 2.0, thread: threading.Thread = None) -> bool:
+    """Poll until something accepts TCP connections on localhost:port.
+    
+    Returns False on timeout, or as soon as `thread` (the server's thread) exits.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            if sock.connect_ex(('127.0.0.1', port)) == 0:
+                return True
+        if thread is not None and not thread.is_alive():
+            return False
+        time.sleep(0.01)
+    return False
+
 # ============================================
 # WEB SERVER
 # ============================================
@@ -91,9 +108,8 @@ def main():
     api_thread = threading.Thread(target=start_physics_api, daemon=True)
     api_thread.start()
 
-    # Give API a moment to start
-    import time
-    time.sleep(2)
+    # Wait (at most 2s) until the API accepts connections, or its thread gives up
+    wait_for_port(8001, timeout=2.0, thread=api_thread)
 
     # Start Web Server in main thread
     try:
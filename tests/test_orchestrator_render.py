@@ -0,0 +1,110 @@
+import colorsys
+
+import numpy as np
+import pytest
+
+from graphics.orchestrator_render import OrchestratorRenderBridge, hsl_to_rgb
+
+
+def _reference(h, s, l):
+    s = min(max(s, 0.0), 1.0)
+    l = min(max(l, 0.0), 1.0)
+    return colorsys.hls_to_rgb(h % 1.0, l, s)
+
+
+@pytest.mark.parametrize("hsl", [
+    (0.0, 0.0, 0.0),
+    (0.0, 1.0, 0.5),
+    (1 / 3, 1.0, 0.5),
+    (2 / 3, 0.25, 0.75),
+    (0.95, 0.6, 0.2),
+    (1.0, 1.0, 0.5),
+    # Out of range: hue wraps, saturation and lightness clamp
+    (-0.3, 0.5, 0.5),
+    (1.7, 0.5, 0.5),
+    (0.5, 1.5, 0.5),
+    (0.5, -0.2, 0.5),
+    (0.5, 1.0, 1.077),
+    (0.0, 1.0, -0.1),
+    (0.25, 2.0, 1.5),
+])
+def test_hsl_to_rgb_matches_colorsys(hsl):
+    rgb = hsl_to_rgb(np.array([hsl]))
+    assert rgb.shape == (1, 3)
+    assert rgb.dtype == np.float32
+    np.testing.assert_allclose(rgb[0], _reference(*hsl), atol=1e-6)
+
+
+def test_hsl_to_rgb_batch_stays_in_unit_range():
+    rng = np.random.default_rng(0)
+    hsl = rng.uniform(-2.0, 3.0, size=(1000, 3))
+    rgb = hsl_to_rgb(hsl)
+    assert rgb.min() >= 0.0 and rgb.max() <= 1.0
+    expected = np.array([_reference(*row) for row in hsl.tolist()])
+    np.testing.assert_allclose(rgb, expected, atol=1e-5)
+
+
+@pytest.mark.parametrize("color, expected", [
+    ("hsl(-108.0, 50.0%, 50.0%)", _reference(-108.0 / 360.0, 0.5, 0.5)),
+    ("hsl(1e-05, 120%, 50%)", _reference(1e-05 / 360.0, 1.0, 0.5)),
+    ("hsl(+.5E2, 30.5%, 107.7%)", _reference(50.0 / 360.0, 0.305, 1.0)),
+])
+def test_bridge_parses_signed_and_exponent_hsl(color, expected):
+    bridge = OrchestratorRenderBridge()
+    bridge.create_object_from_orchestrator("obj", {"colors": {"primary": color}})
+    command = bridge.scene.get_render_command()
+    np.testing.assert_allclose(command["objects"][0]["material"]["color"], expected, atol=1e-6)
+
+
+def test_unparsed_color_drops_queued_hsl():
+    bridge = OrchestratorRenderBridge()
+    bridge.create_object_from_orchestrator("obj", {"colors": {"primary": (0.2, 0.4, 0.6)}})
+    bridge.apply_orchestrator_to_object("obj", {"colors": {"primary": "hsl(0, 100%, 50%)"}})
+    bridge.apply_orchestrator_to_object("obj", {"colors": {"primary": "not a color"}})
+    bridge.flush_colors()
+    assert bridge.scene.get_object("obj").color == (0.2, 0.4, 0.6)
+
+
+def test_render_command_cached_until_scene_changes():
+    bridge = OrchestratorRenderBridge()
+    bridge.create_object_from_orchestrator("obj", {"colors": {"primary": (0.2, 0.4, 0.6)}})
+    first = bridge.scene.get_render_command()
+    assert bridge.scene.get_render_command() is first
+    
+    bridge.scene.get_object("obj").apply_transform(position=(1.0, 2.0, 3.0))
+    second = bridge.scene.get_render_command()
+    assert second is not first
+    assert second["objects"][0]["transform"]["position"] == (1.0, 2.0, 3.0)
+    
+    obj = bridge.scene.get_object("obj")
+    obj.visible = False
+    obj.mark_dirty()
+    assert bridge.scene.get_render_command()["objects"][0]["properties"]["visible"] is False
+
+
+def test_colors_without_primary_keep_queued_hsl():
+    bridge = OrchestratorRenderBridge()
+    bridge.create_object_from_orchestrator("obj", {"colors": {"primary": "hsl(120, 100%, 50%)"}})
+    bridge.apply_orchestrator_to_object("obj", {"colors": {"secondary": "hsl(0, 100%, 50%)"}})
+    bridge.apply_orchestrator_batch([("obj", {"colors": {"secondary": "#ff0000"}})])
+    bridge.flush_colors()
+    np.testing.assert_allclose(bridge.scene.get_object("obj").color, (0.0, 1.0, 0.0), atol=1e-6)
+
+
+def test_numpy_array_color():
+    bridge = OrchestratorRenderBridge()
+    bridge.create_object_from_orchestrator("obj", {"colors": {"primary": np.array([0.25, 0.5, 0.75])}})
+    np.testing.assert_allclose(bridge.scene.get_object("obj").color, (0.25, 0.5, 0.75))
+
+
+def test_mark_dirty_publishes_direct_writes_to_scene_arrays():
+    bridge = OrchestratorRenderBridge()
+    bridge.create_object_from_orchestrator("obj", {"colors": {"primary": (0.2, 0.4, 0.6)}})
+    obj = bridge.scene.get_object("obj")
+    obj.position = (5.0, 5.0, 5.0)
+    obj.color = (1.0, 0.0, 0.0)
+    obj.mark_dirty()
+    status = bridge.get_system_status()
+    assert status["objects"]["positions"] == [[5.0, 5.0, 5.0]]
+    assert status["objects"]["colors"] == [[1.0, 0.0, 0.0]]
+    np.testing.assert_allclose(bridge.scene.compute_world_matrices()[0, :3, 3], (5.0, 5.0, 5.0))